@@ -4,82 +4,311 @@ PostgreSQL connection handling and data operations
 """
 
 import os
+import io
+import copy
+import asyncio
+import csv
+import json
+import atexit
 import logging
+import threading
+from collections import deque
+from cachetools import TTLCache
 from datetime import datetime, timedelta
-from typing import Optional, Dict, List, Any
+from typing import Optional, Dict, List, Any, Union
 from contextlib import asynccontextmanager
-from sqlalchemy.orm import Session
-from sqlalchemy import text
+from sqlalchemy.orm import Session, selectinload, joinedload, defer
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import text, insert, select, delete, func, lambda_stmt
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from uuid_utils.compat import uuid7
 from database import (
-    get_db_session, ContentClassification, ContentTag, ContentAnalysis, 
-    ProcessingLog, SystemMetrics, AIServiceStatus, generate_content_hash,
-    check_database_health, get_database_stats
+    engine, session_scope, get_async_db_session, ContentClassification, ContentTag, ContentAnalysis, 
+    ProcessingLog, AIServiceStatus, generate_content_hash,
+    check_database_health, get_database_stats, ensure_partitions, drop_expired_partitions
 )
 
 logger = logging.getLogger(__name__)
 
+# Pre-bound for the log/metric/status hot paths
+_utcnow = datetime.utcnow
+
+# Buffered write settings for high-volume log/metric tables
+LOG_BUFFER_MAX_ROWS = int(os.getenv("LOG_BUFFER_MAX_ROWS", "500"))
+LOG_BUFFER_FLUSH_INTERVAL = float(os.getenv("LOG_BUFFER_FLUSH_INTERVAL", "5"))
+
+class _LogBuffer:
+    """Accumulate rows in memory and bulk-load them with PostgreSQL COPY"""
+    
+    def __init__(self, table: str, columns: List[str],
+                 max_rows: int = LOG_BUFFER_MAX_ROWS,
+                 flush_interval: float = LOG_BUFFER_FLUSH_INTERVAL):
+        self.table = table
+        self.columns = columns
+        self.max_rows = max_rows
+        self.flush_interval = flush_interval
+        self._rows = deque()
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._wake = threading.Event()
+        self._thread = None
+    
+    def append(self, row: tuple) -> None:
+        """Queue a row; the flusher thread is woken once the size threshold is hit"""
+        with self._lock:
+            self._rows.append(row)
+            if len(self._rows) >= self.max_rows:
+                self._wake.set()
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name=f"{self.table}-flusher", daemon=True
+                )
+                self._thread.start()
+    
+    def _run(self) -> None:
+        """Background flush loop, so COPY never runs on the event loop"""
+        while not self._stop.is_set():
+            self._wake.wait(self.flush_interval)
+            self._wake.clear()
+            self.flush()
+    
+    def flush(self) -> None:
+        """Write all queued rows with a single COPY"""
+        with self._flush_lock:
+            with self._lock:
+                rows = list(self._rows)
+                self._rows.clear()
+            
+            if not rows:
+                return
+            
+            buf = io.StringIO()
+            writer = csv.writer(buf)
+            for row in rows:
+                writer.writerow(['\\N' if value is None else value for value in row])
+            buf.seek(0)
+            
+            raw = engine.raw_connection()
+            try:
+                cursor = raw.cursor()
+                cursor.copy_expert(
+                    f"COPY {self.table} ({', '.join(self.columns)}) "
+                    f"FROM STDIN WITH (FORMAT csv, NULL '\\N')",
+                    buf
+                )
+                raw.commit()
+            except Exception as e:
+                raw.rollback()
+                logger.error("Error flushing %s buffer (%d rows): %s", self.table, len(rows), e)
+            finally:
+                raw.close()
+    
+    def close(self) -> None:
+        """Stop the background thread and flush remaining rows"""
+        self._stop.set()
+        self._wake.set()
+        self.flush()
+
+_processing_log_buffer = _LogBuffer('processing_logs', [
+    'id', 'content_hash', 'processing_type', 'status', 'processing_time_ms',
+    'ai_service_used', 'error_message', 'metadata', 'created_at'
+])
+_metrics_buffer = _LogBuffer('system_metrics', [
+    'id', 'metric_name', 'metric_value', 'metric_unit', 'tags', 'timestamp'
+])
+
+# In-process cache for get_classification_history, invalidated on writes
+HISTORY_CACHE_TTL = int(os.getenv("HISTORY_CACHE_TTL", "60"))
+_history_cache = TTLCache(maxsize=10_000, ttl=HISTORY_CACHE_TTL)
+_history_cache_lock = threading.RLock()
+# Bumped on every invalidation; a load that started before one is not cached
+_history_generation = {'n': 0}
+
+STATUS_FLUSH_INTERVAL = float(os.getenv("STATUS_FLUSH_INTERVAL", "5"))
+
+class _StatusAccumulator:
+    """Coalesce per-service status updates into one upsert per service per interval"""
+    
+    def __init__(self, flush_interval: float = STATUS_FLUSH_INTERVAL):
+        self.flush_interval = flush_interval
+        self._pending: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = None
+    
+    def add(self, service_name: str, status: str, response_time_ms: Optional[int],
+            error_count: int, success_count: int) -> None:
+        """Fold one status update into the pending deltas for the service"""
+        now = _utcnow()
+        with self._lock:
+            entry = self._pending.setdefault(service_name, {
+                'error_count': 0, 'success_count': 0, 'last_successful_call': None
+            })
+            entry['status'] = status
+            entry['response_time_ms'] = response_time_ms
+            entry['error_count'] += error_count
+            entry['success_count'] += success_count
+            if status == 'active':
+                entry['last_successful_call'] = now
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="ai-service-status-flusher", daemon=True
+                )
+                self._thread.start()
+    
+    def _run(self) -> None:
+        """Background timer loop"""
+        while not self._stop.wait(self.flush_interval):
+            self.flush()
+    
+    def flush(self) -> None:
+        """Apply accumulated deltas with INSERT ... ON CONFLICT (service_name) DO UPDATE"""
+        with self._flush_lock:
+            with self._lock:
+                pending = self._pending
+                self._pending = {}
+            
+            if not pending:
+                return
+            
+            now = _utcnow()
+            rows = [
+                {'service_name': name, 'created_at': now, 'updated_at': now, **entry}
+                for name, entry in pending.items()
+            ]
+            stmt = pg_insert(AIServiceStatus)
+            stmt = stmt.on_conflict_do_update(
+                index_elements=['service_name'],
+                set_={
+                    'status': stmt.excluded.status,
+                    'response_time_ms': stmt.excluded.response_time_ms,
+                    'error_count': AIServiceStatus.error_count + stmt.excluded.error_count,
+                    'success_count': AIServiceStatus.success_count + stmt.excluded.success_count,
+                    'last_successful_call': func.coalesce(
+                        stmt.excluded.last_successful_call, AIServiceStatus.last_successful_call
+                    ),
+                    'updated_at': stmt.excluded.updated_at,
+                }
+            )
+            try:
+                with session_scope() as db:
+                    db.execute(stmt, rows)
+            except Exception as e:
+                logger.error("Error flushing AI service status (%d services): %s", len(rows), e)
+    
+    def close(self) -> None:
+        """Stop the background thread and flush remaining deltas"""
+        self._stop.set()
+        self.flush()
+
+_status_accumulator = _StatusAccumulator()
+
+@atexit.register
+def _flush_buffers() -> None:
+    _processing_log_buffer.close()
+    _metrics_buffer.close()
+    _status_accumulator.close()
+
+# Frequently issued lookups as lambda statements: SQLAlchemy caches the
+# constructed and compiled statement keyed on the lambda's code, and the
+# closure variables become bound parameters
+def _select_classification_by_hash(content_hash: str):
+    # Eager-load tags (one extra IN query) and analysis (joined, one-to-one)
+    # so building the result does not trigger lazy loads per relationship;
+    # the full content body is never part of the history payload
+    return lambda_stmt(lambda: select(ContentClassification).options(
+        defer(ContentClassification.content),
+        selectinload(ContentClassification.tags),
+        joinedload(ContentClassification.analysis)
+    ).where(ContentClassification.content_hash == content_hash))
+
+def _select_analysis_by_classification(classification_id: str):
+    return lambda_stmt(lambda: select(ContentAnalysis).where(
+        ContentAnalysis.classification_id == classification_id
+    ))
+
 class DatabaseManager:
     """Database operations manager"""
     
+    __slots__ = ('health_check_interval', 'last_health_check', '_health_status', '_health_lock')
+    
     def __init__(self):
         self.health_check_interval = 300  # 5 minutes
         self.last_health_check = None
         self._health_status = None
+        # Created on first use: on Python < 3.10 an asyncio.Lock binds to the loop
+        # current at construction, which at import time is not uvicorn's
+        self._health_lock = None
+    
+    def _health_cached(self, now: datetime) -> bool:
+        return bool(self.last_health_check and
+                    now - self.last_health_check < timedelta(seconds=self.health_check_interval))
     
     async def health_check(self) -> Dict[str, Any]:
         """Perform database health check with caching"""
-        now = datetime.utcnow()
-        
         # Use cached result if recent
-        if (self.last_health_check and 
-            now - self.last_health_check < timedelta(seconds=self.health_check_interval)):
+        if self._health_cached(_utcnow()):
             return self._health_status
         
-        self._health_status = check_database_health()
-        self.last_health_check = now
-        return self._health_status
+        # Only one caller refreshes; concurrent callers reuse its result
+        if self._health_lock is None:
+            self._health_lock = asyncio.Lock()
+        async with self._health_lock:
+            now = _utcnow()
+            if self._health_cached(now):
+                return self._health_status
+            
+            # The check is a blocking round-trip on the sync engine
+            self._health_status = await asyncio.get_running_loop().run_in_executor(
+                None, check_database_health
+            )
+            self.last_health_check = now
+            return self._health_status
     
-    def save_classification(self, content: str, classification_data: Dict[str, Any], 
-                          ai_service: str, processing_time_ms: int) -> str:
+    async def save_classification(self, content: str, classification_data: Dict[str, Any], 
+                                ai_service: str, processing_time_ms: int,
+                                content_hash: Optional[str] = None) -> str:
         """Save classification result to database"""
         try:
-            with get_db_session() as db:
-                content_hash = generate_content_hash(content)
+            async with get_async_db_session() as db:
+                content_hash = content_hash or generate_content_hash(content)
                 
-                # Check if classification already exists
-                existing = db.query(ContentClassification).filter(
-                    ContentClassification.content_hash == content_hash
-                ).first()
+                now = _utcnow()
                 
-                if existing:
-                    # Update existing classification
-                    existing.category = classification_data.get('category', existing.category)
-                    existing.confidence = classification_data.get('confidence', existing.confidence)
-                    existing.priority = classification_data.get('priority', existing.priority)
-                    existing.status = classification_data.get('status', existing.status)
-                    existing.complexity = classification_data.get('complexity', existing.complexity)
-                    existing.estimated_time = classification_data.get('estimated_time', existing.estimated_time)
-                    existing.reasoning = classification_data.get('reasoning', existing.reasoning)
-                    existing.ai_service_used = ai_service
-                    existing.updated_at = datetime.utcnow()
-                    classification_id = existing.id
-                else:
-                    # Create new classification
-                    classification = ContentClassification(
-                        content_hash=content_hash,
-                        content_preview=content[:500] + "..." if len(content) > 500 else content,
-                        category=classification_data.get('category', '02-Areas'),
-                        confidence=classification_data.get('confidence', 0.5),
-                        priority=classification_data.get('priority', 'normal'),
-                        status=classification_data.get('status', 'active'),
-                        complexity=classification_data.get('complexity', 'medium'),
-                        estimated_time=classification_data.get('estimated_time', '1 hour'),
-                        reasoning=classification_data.get('reasoning', ''),
-                        ai_service_used=ai_service
-                    )
-                    db.add(classification)
-                    db.flush()
-                    classification_id = classification.id
+                # Columns refreshed on conflict: only those the caller supplied,
+                # so an update keeps existing values for anything missing
+                fields = ('category', 'confidence', 'priority', 'status',
+                          'complexity', 'estimated_time', 'reasoning')
+                defaults = {
+                    'category': '02-Areas',
+                    'confidence': 0.5,
+                    'priority': 'normal',
+                    'status': 'active',
+                    'complexity': 'medium',
+                    'estimated_time': '1 hour',
+                    'reasoning': ''
+                }
+                
+                # Single-statement upsert keyed on the unique content_hash; RETURNING
+                # yields the id for both the insert and conflict paths, so no flush
+                # round-trip is needed before logging in the same transaction
+                stmt = pg_insert(ContentClassification).values(
+                    content_hash=content_hash,
+                    content=content,
+                    ai_service_used=ai_service,
+                    created_at=now,
+                    updated_at=now,
+                    **{field: classification_data.get(field, defaults[field]) for field in fields}
+                )
+                update_cols = [field for field in fields if field in classification_data]
+                update_cols += ['ai_service_used', 'updated_at']
+                stmt = stmt.on_conflict_do_update(
+                    index_elements=['content_hash'],
+                    set_={col: stmt.excluded[col] for col in update_cols}
+                ).returning(ContentClassification.id)
+                classification_id = (await db.execute(stmt)).scalar_one()
                 
                 # Log processing
                 self._log_processing(
@@ -87,32 +316,38 @@ class DatabaseManager:
                     processing_time_ms, ai_service
                 )
                 
-                db.commit()
+                await db.commit()
+                self._invalidate_history(content_hash=content_hash)
                 return str(classification_id)
                 
         except Exception as e:
             logger.error(f"Error saving classification: {str(e)}")
             raise
     
-    def save_tags(self, classification_id: str, tags_data: Dict[str, Any], 
-                  ai_service: str, processing_time_ms: int) -> None:
+    async def save_tags(self, classification_id: str, tags_data: Dict[str, Any], 
+                        ai_service: str, processing_time_ms: int) -> None:
         """Save tags to database"""
         try:
-            with get_db_session() as db:
+            async with get_async_db_session() as db:
                 # Clear existing tags for this classification
-                db.query(ContentTag).filter(
+                await db.execute(delete(ContentTag).where(
                     ContentTag.classification_id == classification_id
-                ).delete()
+                ))
                 
-                # Add new tags
-                for tag in tags_data.get('smart_tags', []):
-                    tag_obj = ContentTag(
-                        classification_id=classification_id,
-                        tag=tag,
-                        confidence=tags_data.get('confidence', 0.5),
-                        semantic_group=tags_data.get('semantic_groups', {}).get('general', 'general')
-                    )
-                    db.add(tag_obj)
+                # Add new tags in a single batched INSERT
+                confidence = tags_data.get('confidence', 0.5)
+                semantic_group = tags_data.get('semantic_groups', {}).get('general', 'general')
+                rows = [
+                    {
+                        'classification_id': classification_id,
+                        'tag': tag,
+                        'confidence': confidence,
+                        'semantic_group': semantic_group
+                    }
+                    for tag in tags_data.get('smart_tags', [])
+                ]
+                if rows:
+                    await db.execute(insert(ContentTag), rows)
                 
                 # Log processing
                 self._log_processing(
@@ -121,21 +356,22 @@ class DatabaseManager:
                     metadata={'tag_count': len(tags_data.get('smart_tags', []))}
                 )
                 
-                db.commit()
+                await db.commit()
+                self._invalidate_history(classification_id=classification_id)
                 
         except Exception as e:
             logger.error(f"Error saving tags: {str(e)}")
             raise
     
-    def save_analysis(self, classification_id: str, analysis_data: Dict[str, Any], 
-                     ai_service: str, processing_time_ms: int) -> None:
+    async def save_analysis(self, classification_id: str, analysis_data: Dict[str, Any], 
+                            ai_service: str, processing_time_ms: int) -> None:
         """Save analysis result to database"""
         try:
-            with get_db_session() as db:
+            async with get_async_db_session() as db:
                 # Check if analysis already exists
-                existing = db.query(ContentAnalysis).filter(
-                    ContentAnalysis.classification_id == classification_id
-                ).first()
+                existing = (await db.execute(
+                    _select_analysis_by_classification(classification_id)
+                )).scalars().first()
                 
                 if existing:
                     # Update existing analysis
@@ -167,18 +403,32 @@ class DatabaseManager:
                     metadata={'entities_count': len(analysis_data.get('entities', []))}
                 )
                 
-                db.commit()
+                await db.commit()
+                self._invalidate_history(classification_id=classification_id)
                 
         except Exception as e:
             logger.error(f"Error saving analysis: {str(e)}")
             raise
     
-    def _log_processing(self, db: Session, content_hash: Optional[str], 
+    def _log_processing(self, db: Union[Session, AsyncSession], content_hash: Optional[str], 
                        processing_type: str, status: str, processing_time_ms: int,
                        ai_service: Optional[str] = None, error_message: Optional[str] = None,
                        metadata: Optional[Dict] = None) -> None:
-        """Log processing information"""
+        """Log processing information
+        
+        Successful runs are buffered and bulk-loaded via COPY; anything else is
+        written in the caller's transaction so it is durable immediately.
+        """
         try:
+            if status == 'success':
+                _processing_log_buffer.append((
+                    uuid7(), content_hash or '', processing_type, status,
+                    processing_time_ms, ai_service, error_message,
+                    json.dumps(metadata) if metadata is not None else None,
+                    _utcnow()
+                ))
+                return
+            
             log_entry = ProcessingLog(
                 content_hash=content_hash or '',
                 processing_type=processing_type,
@@ -186,19 +436,55 @@ class DatabaseManager:
                 processing_time_ms=processing_time_ms,
                 ai_service_used=ai_service,
                 error_message=error_message,
-                metadata=metadata
+                meta=metadata
             )
             db.add(log_entry)
         except Exception as e:
             logger.error(f"Error logging processing: {str(e)}")
     
-    def get_classification_history(self, content_hash: str) -> Optional[Dict[str, Any]]:
-        """Get classification history for content"""
+    def _invalidate_history(self, content_hash: Optional[str] = None,
+                            classification_id: Optional[str] = None) -> None:
+        """Drop cached history for a content hash or classification id"""
+        with _history_cache_lock:
+            _history_generation['n'] += 1
+            if content_hash is not None:
+                _history_cache.pop(content_hash, None)
+            if classification_id is not None:
+                # Match on the id stored in each entry, so no separate map can fall out of sync
+                classification_id = str(classification_id)
+                for key in list(_history_cache):
+                    entry = _history_cache.get(key)
+                    if entry is not None and entry['id'] == classification_id:
+                        del _history_cache[key]
+    
+    def clear_history_cache(self) -> None:
+        """Clear the classification history cache"""
+        with _history_cache_lock:
+            _history_generation['n'] += 1
+            _history_cache.clear()
+    
+    async def get_classification_history(self, content_hash: str) -> Optional[Dict[str, Any]]:
+        """Get classification history for content (callers receive their own copy)"""
+        with _history_cache_lock:
+            cached = _history_cache.get(content_hash)
+            generation = _history_generation['n']
+        if cached is not None:
+            return copy.deepcopy(cached)
+        
+        history = await self._load_classification_history(content_hash)
+        if history is not None:
+            with _history_cache_lock:
+                # Skip caching if a write invalidated the history while this load ran
+                if _history_generation['n'] == generation:
+                    _history_cache[content_hash] = copy.deepcopy(history)
+        return history
+    
+    async def _load_classification_history(self, content_hash: str) -> Optional[Dict[str, Any]]:
+        """Load classification history for content from the database"""
         try:
-            with get_db_session() as db:
-                classification = db.query(ContentClassification).filter(
-                    ContentClassification.content_hash == content_hash
-                ).first()
+            async with get_async_db_session() as db:
+                result = await db.execute(_select_classification_by_hash(content_hash))
+                classification = result.unique().scalars().first()
                 
                 if not classification:
                     return None
@@ -241,49 +527,21 @@ class DatabaseManager:
     def update_ai_service_status(self, service_name: str, status: str, 
                                response_time_ms: Optional[int] = None,
                                error_count: int = 0, success_count: int = 0) -> None:
-        """Update AI service status"""
+        """Update AI service status (coalesced, flushed periodically)"""
         try:
-            with get_db_session() as db:
-                service_status = db.query(AIServiceStatus).filter(
-                    AIServiceStatus.service_name == service_name
-                ).first()
-                
-                if service_status:
-                    service_status.status = status
-                    service_status.response_time_ms = response_time_ms
-                    service_status.error_count += error_count
-                    service_status.success_count += success_count
-                    if status == 'active':
-                        service_status.last_successful_call = datetime.utcnow()
-                    service_status.updated_at = datetime.utcnow()
-                else:
-                    service_status = AIServiceStatus(
-                        service_name=service_name,
-                        status=status,
-                        response_time_ms=response_time_ms,
-                        error_count=error_count,
-                        success_count=success_count,
-                        last_successful_call=datetime.utcnow() if status == 'active' else None
-                    )
-                    db.add(service_status)
-                
-                db.commit()
+            _status_accumulator.add(service_name, status, response_time_ms, error_count, success_count)
         except Exception as e:
             logger.error(f"Error updating AI service status: {str(e)}")
     
     def record_metric(self, metric_name: str, metric_value: float, 
                      metric_unit: str = None, tags: Dict[str, Any] = None) -> None:
-        """Record a system metric"""
+        """Record a system metric (buffered, flushed via COPY)"""
         try:
-            with get_db_session() as db:
-                metric = SystemMetrics(
-                    metric_name=metric_name,
-                    metric_value=metric_value,
-                    metric_unit=metric_unit,
-                    tags=tags
-                )
-                db.add(metric)
-                db.commit()
+            _metrics_buffer.append((
+                uuid7(), metric_name, metric_value, metric_unit,
+                json.dumps(tags) if tags is not None else None,
+                _utcnow()
+            ))
         except Exception as e:
             logger.error(f"Error recording metric: {str(e)}")
 
@@ -294,11 +552,8 @@ db_manager = DatabaseManager()
 @asynccontextmanager
 async def get_async_db():
     """Async context manager for database operations"""
-    db = get_db_session()
-    try:
+    async with get_async_db_session() as db:
         yield db
-    finally:
-        db.close()
 
 # Utility functions
 def initialize_database():
@@ -307,35 +562,53 @@ def initialize_database():
         from database import create_tables
         create_tables()
         logger.info("Database tables created successfully")
+        logger.info("Content hashing: BLAKE3")
     except Exception as e:
         logger.error(f"Error initializing database: {str(e)}")
         raise
 
+# Rows removed per DELETE statement in cleanup_old_data
+CLEANUP_BATCH_SIZE = int(os.getenv("CLEANUP_BATCH_SIZE", "10000"))
+
+def _delete_in_batches(db: Session, table: str, column: str, cutoff_date: datetime) -> int:
+    """Delete rows older than cutoff in bounded chunks, committing between chunks
+    
+    After drop_expired_partitions only the default partition and the month that
+    contains the cutoff can still hold expired rows. Each is deleted from directly:
+    a ctid is only unique within one leaf table, never across the partitioned parent.
+    """
+    deleted = 0
+    for partition in (f"{table}_default", f"{table}_{cutoff_date:%Y_%m}"):
+        if db.execute(text("SELECT to_regclass(:name)"), {"name": partition}).scalar() is None:
+            continue
+        stmt = text(
+            f"DELETE FROM {partition} WHERE {column} < :cutoff AND ctid IN "
+            f"(SELECT ctid FROM {partition} WHERE {column} < :cutoff LIMIT :limit)"
+        )
+        while True:
+            result = db.execute(stmt, {"cutoff": cutoff_date, "limit": CLEANUP_BATCH_SIZE})
+            db.commit()
+            deleted += result.rowcount
+            if result.rowcount < CLEANUP_BATCH_SIZE:
+                break
+    return deleted
+
 def cleanup_old_data(days_to_keep: int = 30):
     """Clean up old data"""
     try:
-        with get_db_session() as db:
+        with session_scope() as db:
             cutoff_date = datetime.utcnow() - timedelta(days=days_to_keep)
             
-            # Clean up old processing logs
-            old_logs = db.query(ProcessingLog).filter(
-                ProcessingLog.created_at < cutoff_date
-            ).count()
-            db.query(ProcessingLog).filter(
-                ProcessingLog.created_at < cutoff_date
-            ).delete()
+            # Roll partitions forward and drop whole months past the cutoff
+            ensure_partitions()
+            dropped_partitions = drop_expired_partitions(cutoff_date)
             
-            # Clean up old metrics
-            old_metrics = db.query(SystemMetrics).filter(
-                SystemMetrics.timestamp < cutoff_date
-            ).count()
-            db.query(SystemMetrics).filter(
-                SystemMetrics.timestamp < cutoff_date
-            ).delete()
+            # Delete the remainder from the boundary month (and default partition)
+            old_logs = _delete_in_batches(db, 'processing_logs', 'created_at', cutoff_date)
+            old_metrics = _delete_in_batches(db, 'system_metrics', 'timestamp', cutoff_date)
             
-            db.commit()
-            logger.info(f"Cleaned up {old_logs} old logs and {old_metrics} old metrics")
+            logger.info("Cleaned up %d old logs and %d old metrics (%d expired partitions dropped)",
+                        old_logs, old_metrics, dropped_partitions)
     except Exception as e:
         logger.error(f"Error cleaning up old data: {str(e)}")
         raise
-
@@ -4,50 +4,127 @@ AI 기반 고급 콘텐츠 분류 및 스마트 태깅 시스템
 """
 
 import os
-import json
+import re
 import logging
 import time
-from typing import Dict, List, Optional, Any
+import asyncio
+from collections import deque
+from functools import lru_cache, partial
+from typing import Dict, List, Optional, Any, Tuple, Final
 from datetime import datetime
 from pathlib import Path
 
 import uvicorn
-from fastapi import FastAPI, HTTPException, BackgroundTasks, Depends
+from fastapi import FastAPI, HTTPException, BackgroundTasks, Depends, Request
 from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel, Field
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel, Field, TypeAdapter
 import openai
 import anthropic
 import httpx
+import orjson
+import msgspec
+import ahocorasick
+import xxhash
+import tiktoken
+from cachetools import TTLCache
 from dotenv import load_dotenv
 
 # Import database modules
-from database import get_db, initialize_database, check_database_health
-from db_utils import db_manager, generate_content_hash
+from database import get_db, check_database_health, ensure_partitions
+from db_utils import db_manager, generate_content_hash, initialize_database
+from semantic_cache import SemanticCache
+from response_cache import ResponseCache
 
 # Load environment variables
 load_dotenv()
 
 # Configure logging
-logging.basicConfig(level=logging.INFO)
+logging.basicConfig(level=os.getenv("LOG_LEVEL", "INFO").upper())
 logger = logging.getLogger(__name__)
 
 # FastAPI 앱 초기화
+class ORJSONResponse(JSONResponse):
+    """orjson으로 직렬화하는 기본 응답 클래스 (최신 FastAPI에서 내장 ORJSONResponse는 폐기 예정)"""
+    
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
+
 app = FastAPI(
     title="2nd-Brain-Auto AI 서비스",
     description="P.A.R.A 방법론을 위한 AI 기반 콘텐츠 분류 및 스마트 태깅",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=ORJSONResponse
 )
 
+# 공유 Perplexity HTTP 클라이언트 (HTTP/2 다중화, 연결 재사용, 인증 헤더 고정)
+PERPLEXITY_CLIENT: Optional[httpx.AsyncClient] = None
+
+def _create_perplexity_client() -> httpx.AsyncClient:
+    return httpx.AsyncClient(
+        http2=True,
+        base_url="https://api.perplexity.ai",
+        headers={"Authorization": f"Bearer {perplexity_api_key}"},
+        limits=httpx.Limits(max_connections=200, max_keepalive_connections=100),
+        timeout=httpx.Timeout(60.0, connect=5.0)
+    )
+
+def get_perplexity_client() -> httpx.AsyncClient:
+    """공유 Perplexity 클라이언트 반환 (시작 이벤트 전이면 생성)"""
+    global PERPLEXITY_CLIENT
+    if PERPLEXITY_CLIENT is None:
+        PERPLEXITY_CLIENT = _create_perplexity_client()
+    return PERPLEXITY_CLIENT
+
+# 월별 파티션 롤링 주기 (초); 다음 달 파티션을 미리 만들어 기본 파티션으로 행이 쌓이지 않게 함
+# 워커마다 타이머가 돌지만 advisory 잠금을 잡은 한 워커만 실제로 롤링하고 나머지는 건너뜀
+PARTITION_ROLL_INTERVAL = float(os.getenv("PARTITION_ROLL_INTERVAL", "86400"))
+_partition_task: Optional[asyncio.Task] = None
+
+async def _roll_partitions() -> None:
+    while True:
+        await asyncio.sleep(PARTITION_ROLL_INTERVAL)
+        try:
+            await asyncio.get_running_loop().run_in_executor(None, partial(ensure_partitions, wait=False))
+        except Exception as e:
+            logger.warning("파티션 롤링 실패: %s", e)
+
 # 시작 시 데이터베이스 초기화
 @app.on_event("startup")
 async def startup_event():
-    """시작 시 데이터베이스 초기화"""
+    """시작 시 데이터베이스 초기화 및 AI 서비스 인스턴스 생성"""
+    get_perplexity_client()
+    app.state.classifier = AIClassificationService()
+    app.state.tagger = AITaggingService()
+    app.state.analyzer = AIAnalysisService()
+    app.state.processor = AIProcessingService(app.state.tagger, app.state.analyzer)
+    for cache in _SEMANTIC_CACHES:
+        cache.load()
     try:
         initialize_database()
         logger.info("데이터베이스 초기화 완료")
     except Exception as e:
-        logger.error(f"데이터베이스 초기화 실패: {str(e)}")
+        logger.error("데이터베이스 초기화 실패: %s", e)
         raise
+    global _partition_task
+    _partition_task = asyncio.create_task(_roll_partitions())
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    """종료 시 공유 HTTP 클라이언트 정리 및 캐시 저장"""
+    global PERPLEXITY_CLIENT
+    if _partition_task is not None:
+        _partition_task.cancel()
+    if _background_writes:
+        await asyncio.wait(list(_background_writes.values()))
+    for cache in _SEMANTIC_CACHES:
+        cache.save()
+    await response_cache.close()
+    if openai_client is not None:
+        await openai_client.close()
+    if PERPLEXITY_CLIENT is not None:
+        await PERPLEXITY_CLIENT.aclose()
+        PERPLEXITY_CLIENT = None
 
 # CORS 미들웨어 추가
 app.add_middleware(
@@ -59,12 +136,375 @@ app.add_middleware(
 )
 
 # AI 서비스 설정
-openai.api_key = os.getenv("OPENAI_API_KEY")
-anthropic_client = anthropic.Anthropic(api_key=os.getenv("ANTHROPIC_API_KEY"))
+openai_api_key = os.getenv("OPENAI_API_KEY")
+# 비동기 클라이언트: 요청 중 이벤트 루프를 막지 않음 (전역 openai.api_key 상태는 사용하지 않음)
+# OpenAI는 aiohttp 전송 계층 사용 (동시 요청에서 기본 httpx 전송보다 지연시간이 낮음)
+openai_client = (
+    openai.AsyncOpenAI(api_key=openai_api_key, http_client=openai.DefaultAioHttpClient())
+    if openai_api_key else None
+)
+anthropic_client = anthropic.AsyncAnthropic(api_key=os.getenv("ANTHROPIC_API_KEY"))
 perplexity_api_key = os.getenv("PERPLEXITY_API_KEY")
 primary_ai_service = os.getenv("PRIMARY_AI_SERVICE", "anthropic")
+ai_concurrency = int(os.getenv("AI_CONCURRENCY", "16"))
 fallback_ai_service = os.getenv("FALLBACK_AI_SERVICE", "openai")
 
+# 제공자 응답 캐시 (동일 프롬프트는 워커 간 Redis로 공유)
+response_cache = ResponseCache(os.getenv("REDIS_URL"))
+
+# 토큰 기준 콘텐츠 잘라내기 (문자 슬라이싱 대신 실제 모델 토큰 수로 예산 관리)
+CLASSIFY_CONTENT_TOKENS = int(os.getenv("CLASSIFY_CONTENT_TOKENS", "6000"))
+TAGGING_CONTENT_TOKENS = int(os.getenv("TAGGING_CONTENT_TOKENS", "400"))
+ANALYSIS_CONTENT_TOKENS = int(os.getenv("ANALYSIS_CONTENT_TOKENS", "800"))
+EMBEDDING_CONTENT_TOKENS = 8000
+
+try:
+    _ENC = tiktoken.get_encoding("cl100k_base")
+except Exception as e:
+    logger.warning("tiktoken 인코딩 로드 실패, 문자 단위로 잘라냄: %s", e)
+    _ENC = None
+
+def _truncate(text: str, n: int) -> str:
+    """text를 최대 n 토큰으로 잘라냄"""
+    if _ENC is None:
+        return text[:n]
+    if len(text.encode("utf-8")) <= n:
+        # byte-level BPE 토큰은 최소 1바이트이므로 잘라낼 필요 없음 (한글 한 글자는 여러 토큰일 수 있음)
+        return text
+    ids = _ENC.encode(text, disallowed_special=())
+    if len(ids) <= n:
+        return text
+    # 멀티바이트 문자 중간에서 잘린 경우 깨진 마지막 글자 제거
+    return _ENC.decode(ids[:n]).rstrip("\ufffd")
+
+# 프로세스 내 결과 캐시: 반복 요청은 DB 조회 없이 바로 반환
+RESULT_CACHE_MAX_SIZE = int(os.getenv("RESULT_CACHE_MAX_SIZE", "10000"))
+RESULT_CACHE_TTL = int(os.getenv("RESULT_CACHE_TTL", "3600"))
+_CLASSIFY_CACHE = TTLCache(maxsize=RESULT_CACHE_MAX_SIZE, ttl=RESULT_CACHE_TTL)
+_TAGGING_CACHE = TTLCache(maxsize=RESULT_CACHE_MAX_SIZE, ttl=RESULT_CACHE_TTL)
+_ANALYSIS_CACHE = TTLCache(maxsize=RESULT_CACHE_MAX_SIZE, ttl=RESULT_CACHE_TTL)
+
+def _cache_key(content: str) -> int:
+    """프로세스 내 캐시 키 (xxh3; DB content_hash는 BLAKE3 유지)"""
+    return xxhash.xxh3_64_intdigest(content.encode("utf-8", "ignore"))
+
+# 백그라운드 DB 쓰기 (응답은 저장 완료를 기다리지 않음)
+_background_writes: Dict[str, asyncio.Task] = {}
+
+def _spawn_write(content_hash: str, coro) -> None:
+    """콘텐츠 해시별 저장 작업을 백그라운드 태스크로 실행"""
+    task = asyncio.create_task(coro)
+    _background_writes[content_hash] = task
+    task.add_done_callback(lambda t: _finish_write(content_hash, t))
+
+def _finish_write(content_hash: str, task: asyncio.Task) -> None:
+    if _background_writes.get(content_hash) is task:
+        del _background_writes[content_hash]
+    if not task.cancelled() and task.exception() is not None:
+        logger.error("백그라운드 저장 실패 (%s): %s", content_hash, task.exception())
+
+async def _wait_pending_write(content_hash: str) -> None:
+    """같은 콘텐츠의 진행 중인 저장이 있으면 완료될 때까지 대기"""
+    task = _background_writes.get(content_hash)
+    if task is not None:
+        await asyncio.wait({task})
+
+# 진행 중인 AI 호출 합치기: 같은 콘텐츠의 동시 요청은 하나의 태스크 결과를 공유
+_CLASSIFY_INFLIGHT: Dict[int, asyncio.Future] = {}
+_TAGGING_INFLIGHT: Dict[int, asyncio.Future] = {}
+_ANALYSIS_INFLIGHT: Dict[int, asyncio.Future] = {}
+_PROCESS_INFLIGHT: Dict[int, asyncio.Future] = {}
+
+async def _coalesce(inflight: Dict[int, asyncio.Future], key: int, make_work) -> Any:
+    """key에 대해 진행 중인 작업이 있으면 그 결과를 기다리고, 없으면 새로 시작"""
+    task = inflight.get(key)
+    if task is None:
+        task = asyncio.ensure_future(make_work())
+        inflight[key] = task
+        task.add_done_callback(lambda t: _release_inflight(inflight, key, t))
+    # shield: 한 호출자가 취소돼도 다른 대기자의 작업은 계속 진행
+    return await asyncio.shield(task)
+
+def _release_inflight(inflight: Dict[int, asyncio.Future], key: int, task: asyncio.Future) -> None:
+    if inflight.get(key) is task:
+        del inflight[key]
+    if not task.cancelled():
+        # 대기자가 모두 취소된 경우에도 "exception was never retrieved" 경고 방지
+        task.exception()
+
+# 시맨틱 캐시: 표현만 다른 거의 같은 콘텐츠는 이전 AI 결과를 재사용
+EMBEDDING_MODEL = os.getenv("EMBEDDING_MODEL", "text-embedding-3-small")
+_CLASSIFY_SEMANTIC = SemanticCache("classification")
+_TAGGING_SEMANTIC = SemanticCache("tagging")
+_ANALYSIS_SEMANTIC = SemanticCache("analysis")
+_SEMANTIC_CACHES = (_CLASSIFY_SEMANTIC, _TAGGING_SEMANTIC, _ANALYSIS_SEMANTIC)
+_EMBEDDING_CACHE = TTLCache(maxsize=RESULT_CACHE_MAX_SIZE, ttl=RESULT_CACHE_TTL)
+
+async def _embed_content(content: str, cache_key: int) -> Optional[List[float]]:
+    """콘텐츠 임베딩 (분류/태깅/분석 간 공유, 실패 시 None)"""
+    if openai_client is None or not _CLASSIFY_SEMANTIC.enabled:
+        return None
+    embedding = _EMBEDDING_CACHE.get(cache_key)
+    if embedding is None:
+        try:
+            response = await openai_client.embeddings.create(model=EMBEDDING_MODEL, input=_truncate(content, EMBEDDING_CONTENT_TOKENS))
+            embedding = response.data[0].embedding
+        except Exception as e:
+            logger.warning("임베딩 생성 실패, 시맨틱 캐시 건너뜀: %s", e)
+            return None
+        _EMBEDDING_CACHE[cache_key] = embedding
+    return embedding
+
+# 제공자 오류는 상위 장애(503)로 보고하고, 장애 중 로그 폭주를 막기 위해 제공자별로 샘플링
+PROVIDER_ERROR_STATUS: Final = 503
+PROVIDER_ERROR_LOG_INTERVAL = float(os.getenv("PROVIDER_ERROR_LOG_INTERVAL", "10"))
+_PROVIDER_ERROR_DETAIL: Final = {
+    "anthropic": "Anthropic API temporarily unavailable",
+    "perplexity": "Perplexity API temporarily unavailable",
+    "openai": "OpenAI API temporarily unavailable",
+}
+_error_log_state: Dict[str, List[float]] = {}  # 로그 키 -> [마지막 기록 시각, 생략된 건수]
+
+def _log_sampled(key: str, msg: str, *args: Any, exc_info: Optional[BaseException] = None) -> None:
+    """key별로 PROVIDER_ERROR_LOG_INTERVAL마다 한 번만 기록하고, 그 사이 오류는 건수만 집계"""
+    now = time.monotonic()
+    state = _error_log_state.setdefault(key, [float("-inf"), 0])
+    if now - state[0] >= PROVIDER_ERROR_LOG_INTERVAL:
+        logger.error(msg + " (%d similar suppressed)", *args, state[1], exc_info=exc_info)
+        state[0] = now
+        state[1] = 0
+    else:
+        state[1] += 1
+
+def _provider_error(provider: str, e: Exception) -> HTTPException:
+    """오류를 샘플링해 기록하고 호출자가 raise할 503 예외 반환
+    
+    예외 인스턴스는 공유하지 않음: 재사용하면 동시 요청 간 __cause__/traceback이 섞이고 계속 늘어남
+    """
+    _log_sampled(provider, "%s API error: %s", provider, e, exc_info=e)
+    return HTTPException(status_code=PROVIDER_ERROR_STATUS, detail=_PROVIDER_ERROR_DETAIL[provider])
+
+# 적응형 라우팅: 제공자별 EWMA 지연시간/오류율을 추적하고 장애 제공자는 서킷 차단
+PROVIDER_FAILURE_THRESHOLD = 3      # 60초 안에 이 횟수를 넘게 실패하면 차단
+PROVIDER_FAILURE_WINDOW = 60.0
+PROVIDER_OPEN_SECONDS = 30.0        # 첫 차단 시간, 연속 차단마다 두 배
+PROVIDER_OPEN_MAX_SECONDS = 600.0
+PROVIDER_FAILURE_LATENCY_MS = 10000.0  # 실패는 이 지연시간으로 EWMA에 반영 (빨리 실패해도 빠른 제공자가 되지 않음)
+PROVIDER_ERROR_WEIGHT = 10.0        # 점수 = ewma_ms * (1 + 가중치 * 오류율)
+
+class _ProviderRouter:
+    """primary/fallback 제공자 중 현재 가장 빠르고 건강한 쪽을 선택"""
+    
+    def __init__(self, providers: List[str], initial_ewma_ms: float = 1000.0):
+        # 중복 제거, 순서 유지 (동률이면 primary 우선)
+        self.providers = list(dict.fromkeys(providers))
+        self.stats = {
+            name: {"ewma_ms": initial_ewma_ms, "err_rate": 0.0, "open_until": 0.0,
+                   "open_seconds": PROVIDER_OPEN_SECONDS, "failures": deque()}
+            for name in self.providers
+        }
+    
+    def _score(self, name: str) -> float:
+        stats = self.stats[name]
+        return stats["ewma_ms"] * (1.0 + PROVIDER_ERROR_WEIGHT * stats["err_rate"])
+    
+    def pick(self, exclude: Optional[str] = None) -> str:
+        """서킷이 닫혀 있는 제공자 중 오류율을 반영한 EWMA 지연시간 점수가 가장 낮은 제공자"""
+        now = time.monotonic()
+        candidates = [name for name in self.providers
+                      if name != exclude and self.stats[name]["open_until"] <= now]
+        if not candidates:
+            raise RuntimeError("No healthy AI service available")
+        return min(candidates, key=self._score)
+    
+    def record_success(self, provider: str, elapsed_ms: float) -> None:
+        stats = self.stats.get(provider)
+        if stats is None:
+            return
+        stats["ewma_ms"] = 0.9 * stats["ewma_ms"] + 0.1 * elapsed_ms
+        stats["err_rate"] = 0.9 * stats["err_rate"]
+        stats["open_seconds"] = PROVIDER_OPEN_SECONDS
+    
+    def record_failure(self, provider: str, elapsed_ms: float = 0.0) -> None:
+        stats = self.stats.get(provider)
+        if stats is None:
+            return
+        now = time.monotonic()
+        stats["ewma_ms"] = 0.9 * stats["ewma_ms"] + 0.1 * max(elapsed_ms, PROVIDER_FAILURE_LATENCY_MS)
+        stats["err_rate"] = 0.9 * stats["err_rate"] + 0.1
+        failures = stats["failures"]
+        failures.append(now)
+        while failures and failures[0] < now - PROVIDER_FAILURE_WINDOW:
+            failures.popleft()
+        if len(failures) > PROVIDER_FAILURE_THRESHOLD:
+            stats["open_until"] = now + stats["open_seconds"]
+            logger.warning("%s 서킷 차단 %.0f초", provider, stats["open_seconds"])
+            stats["open_seconds"] = min(stats["open_seconds"] * 2, PROVIDER_OPEN_MAX_SECONDS)
+            failures.clear()
+    
+    async def call(self, provider: str, coro) -> str:
+        """제공자 호출을 측정하여 통계 갱신"""
+        start = time.perf_counter()
+        try:
+            result = await coro
+        except Exception:
+            self.record_failure(provider, (time.perf_counter() - start) * 1000)
+            raise
+        self.record_success(provider, (time.perf_counter() - start) * 1000)
+        return result
+    
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        now = time.monotonic()
+        return {
+            name: {"ewma_ms": round(stats["ewma_ms"], 1),
+                   "err_rate": round(stats["err_rate"], 3),
+                   "circuit_open": stats["open_until"] > now}
+            for name, stats in self.stats.items()
+        }
+
+_provider_router = _ProviderRouter([primary_ai_service, fallback_ai_service])
+
+class _JsonObjectScanner:
+    """스트리밍 텍스트에서 최상위 JSON 객체가 닫히는 지점 감지 (문자열 안의 괄호는 무시)"""
+    __slots__ = ("parts", "depth", "started", "in_string", "escaped")
+    
+    def __init__(self):
+        self.parts: List[str] = []
+        self.depth = 0
+        self.started = False
+        self.in_string = False
+        self.escaped = False
+    
+    def feed(self, chunk: str) -> bool:
+        """chunk를 누적하고, 객체가 닫혔으면 닫는 괄호까지만 남기고 True 반환"""
+        for i, ch in enumerate(chunk):
+            if self.in_string:
+                if self.escaped:
+                    self.escaped = False
+                elif ch == "\\":
+                    self.escaped = True
+                elif ch == '"':
+                    self.in_string = False
+            elif ch == '"':
+                self.in_string = True
+            elif ch == "{":
+                self.depth += 1
+                self.started = True
+            elif ch == "}" and self.started:
+                self.depth -= 1
+                if self.depth == 0:
+                    self.parts.append(chunk[:i + 1])
+                    return True
+        self.parts.append(chunk)
+        return False
+    
+    def text(self) -> str:
+        return "".join(self.parts)
+
+async def _read_json_stream(texts, initial: str = "") -> str:
+    """텍스트 스트림을 JSON 객체가 완성될 때까지만 읽음 (나머지 생성은 기다리지 않음)"""
+    scanner = _JsonObjectScanner()
+    if initial:
+        scanner.feed(initial)
+    async for text in texts:
+        if text and scanner.feed(text):
+            break
+    return scanner.text()
+
+# JSON 구조 문자만 건너뛰며 찾는 패턴 (모듈 로드 시 한 번 컴파일)
+_JSON_STRUCT_RE = re.compile(r'[{}"\\]')
+
+def _find_json_span(text: str) -> Optional[Tuple[int, int]]:
+    """첫 번째 균형 잡힌 {...} 구간을 단일 순방향 스캔으로 찾음 (문자열 안의 괄호와 이스케이프 무시)"""
+    start = text.find("{")
+    if start < 0:
+        return None
+    depth = 0
+    in_string = False
+    escaped_at = -1
+    for match in _JSON_STRUCT_RE.finditer(text, start):
+        i = match.start()
+        if i == escaped_at:
+            continue
+        ch = text[i]
+        if in_string:
+            if ch == "\\":
+                escaped_at = i + 1
+            elif ch == '"':
+                in_string = False
+        elif ch == '"':
+            in_string = True
+        elif ch == "{":
+            depth += 1
+        elif ch == "}":
+            depth -= 1
+            if depth == 0:
+                return start, i + 1
+    return None
+
+# 실제로 사용하는 필드만 정의한 msgspec 스키마 (나머지 필드는 객체 생성 없이 건너뜀)
+class _ChatMessage(msgspec.Struct):
+    content: str
+
+class _ChatChoice(msgspec.Struct):
+    message: _ChatMessage
+
+class _ChatCompletion(msgspec.Struct):
+    choices: List[_ChatChoice]
+
+class _AnalysisPayload(msgspec.Struct):
+    entities: List[str]
+    sentiment: str
+    complexity_score: float
+    key_concepts: List[str]
+    summary: str
+    language: str
+
+class _ChatDelta(msgspec.Struct):
+    content: Optional[str] = None
+
+class _ChatChunkChoice(msgspec.Struct):
+    delta: _ChatDelta
+
+class _ChatChunk(msgspec.Struct):
+    choices: List[_ChatChunkChoice]
+
+_CHAT_DECODER = msgspec.json.Decoder(_ChatCompletion)
+_CHUNK_DECODER = msgspec.json.Decoder(_ChatChunk)
+_ANALYSIS_DECODER = msgspec.json.Decoder(_AnalysisPayload)
+
+def _loads_json_object(response: str) -> Optional[Dict]:
+    """JSON 모드 응답 빠른 경로: 응답 전체가 JSON 객체이면 바로 파싱"""
+    if response.lstrip().startswith('{'):
+        try:
+            return orjson.loads(response)
+        except orjson.JSONDecodeError:
+            pass
+    return None
+
+async def _sse_deltas(response: httpx.Response):
+    """OpenAI 호환 SSE 스트림에서 delta.content 텍스트만 순서대로 추출"""
+    async for line in response.aiter_lines():
+        if not line.startswith("data:"):
+            continue
+        data = line[5:].strip()
+        if data == "[DONE]":
+            return
+        for choice in _CHUNK_DECODER.decode(data).choices:
+            yield choice.delta.content
+
+async def _stream_perplexity(payload: Dict[str, Any]) -> str:
+    """Perplexity 스트리밍 호출: JSON 객체가 닫히는 즉시 반환하고 연결 종료"""
+    async with get_perplexity_client().stream(
+        "POST", "/chat/completions", json={**payload, "stream": True}
+    ) as response:
+        response.raise_for_status()
+        if not response.headers.get("content-type", "").startswith("text/event-stream"):
+            # 스트리밍을 지원하지 않는 응답이면 전체 본문을 한 번에 디코딩
+            await response.aread()
+            return _CHAT_DECODER.decode(response.content).choices[0].message.content
+        return await _read_json_stream(_sse_deltas(response))
+
 # P.A.R.A 분류 모델
 PARA_CLASSIFICATION_MODEL = {
     "01-Projects": {
@@ -93,6 +533,30 @@ PARA_CLASSIFICATION_MODEL = {
     }
 }
 
+# 키워드 목록은 임포트 시 frozenset으로 고정 (변경 불가, 해시 조회)
+for _rules in PARA_CLASSIFICATION_MODEL.values():
+    for _field in ("keywords", "ai_patterns", "priority_keywords"):
+        _rules[_field] = frozenset(_rules[_field])
+del _rules, _field
+
+def _build_para_automaton() -> "ahocorasick.Automaton":
+    """P.A.R.A 키워드 전체를 한 번의 스캔으로 찾는 Aho-Corasick 오토마톤 생성"""
+    keyword_categories: Dict[str, List[str]] = {}
+    for category, rules in PARA_CLASSIFICATION_MODEL.items():
+        for keyword in rules["keywords"] | rules["priority_keywords"]:
+            keyword_categories.setdefault(keyword, []).append(category)
+    
+    automaton = ahocorasick.Automaton()
+    for keyword, categories in keyword_categories.items():
+        automaton.add_word(keyword, tuple(categories))
+    automaton.make_automaton()
+    return automaton
+
+_PARA_AC = _build_para_automaton()
+
+# 규칙 기반 태깅에서 제외할 불용어
+_TAGGING_STOPWORDS = frozenset({"the", "a", "an", "and", "or", "but", "in", "on", "at", "to", "for", "of", "with", "by"})
+
 # Pydantic 모델
 class ClassificationRequest(BaseModel):
     content: str = Field(..., description="Content to classify")
@@ -133,8 +597,125 @@ class AnalysisResponse(BaseModel):
     summary: str = Field(..., description="Content summary")
     language: str = Field(..., description="Detected language")
 
+class ProcessRequest(BaseModel):
+    content: str = Field(..., description="Content to process")
+    title: Optional[str] = Field(None, description="Content title")
+    context: Optional[Dict[str, Any]] = Field(None, description="Additional context")
+
+class ProcessResponse(BaseModel):
+    classification: ClassificationResponse
+    tags: TaggingResponse
+    analysis: AnalysisResponse
+    content_hash: str
+
+# 모듈 수준 검증기 (모델 생성자 경로보다 빠름)
+_CLASSIFY_ADAPTER = TypeAdapter(ClassificationResponse)
+_TAGGING_ADAPTER = TypeAdapter(TaggingResponse)
+_ANALYSIS_ADAPTER = TypeAdapter(AnalysisResponse)
+
+# 제공자 모델과 시스템 프롬프트 (요청마다 새로 만들지 않도록 모듈 상수로 고정)
+ANTHROPIC_MODEL: Final[str] = "claude-3-5-sonnet-20241022"
+OPENAI_MODEL: Final[str] = "gpt-4o"
+PERPLEXITY_MODEL: Final[str] = "llama-3.1-sonar-small-128k-online"
+
+SYSTEM_PARA: Final[str] = "You are an expert in knowledge management and the P.A.R.A methodology. Provide accurate, structured responses."
+SYSTEM_TAGGER: Final[str] = "You are an expert in content tagging and knowledge organization. Generate precise, useful tags."
+SYSTEM_ANALYST: Final[str] = "You are an expert content analyst. Provide detailed, accurate analysis."
+
+# Anthropic 응답을 JSON 객체로 시작시키는 프리필 메시지
+_ASSISTANT_PREFILL: Final[Dict[str, str]] = {"role": "assistant", "content": "{"}
+_JSON_RESPONSE_FORMAT: Final[Dict[str, str]] = {"type": "json_object"}
+
+# 정적 프롬프트 조각 (임포트 시 한 번 생성; 접두부는 Anthropic 프롬프트 캐시 대상)
+CLASSIFY_PREFIX = """Analyze the following content and classify it according to the P.A.R.A methodology.
+
+P.A.R.A Categories:
+1. 01-Projects: Tasks with clear deadlines and specific deliverables
+2. 02-Areas: Areas that need ongoing maintenance and management
+3. 03-Resources: Information that may be useful in the future
+4. 04-Archives: Completed projects or inactive areas
+
+Content: """
+
+CLASSIFY_SUFFIX = """
+Please respond with a JSON object containing:
+- category: The P.A.R.A category (01-Projects, 02-Areas, 03-Resources, 04-Archives)
+- confidence: Confidence score (0-1)
+- priority: Priority level (urgent, important, normal)
+- status: Status (active, completed, on-hold)
+- complexity: Complexity level (low, medium, high)
+- estimated_time: Estimated time to complete/process (e.g., "30 minutes", "2 hours", "1 day")
+- reasoning: Brief explanation of the classification decision
+"""
+
+TAGGING_PREFIX = """Generate smart tags for the following content:
+
+"""
+
+TAGGING_SUFFIX = """
+Please respond with a JSON object containing:
+- smart_tags: List of 5-10 relevant, specific tags
+- confidence: Confidence score (0-1)
+- semantic_groups: Object grouping related tags (e.g., {"technical": ["api", "database"], "business": ["strategy", "planning"]})
+- related_topics: List of 3-5 related topics for further exploration
+
+Focus on:
+- Specific, actionable tags
+- Technical terms when appropriate
+- Business context
+- Time sensitivity
+- Complexity indicators
+"""
+
+ANALYSIS_PREFIX = """Analyze the following content and provide insights:
+
+"""
+
+ANALYSIS_SUFFIX = """
+Please respond with a JSON object containing:
+- entities: List of important entities (people, places, organizations, concepts)
+- sentiment: Overall sentiment (positive, negative, neutral)
+- complexity_score: Complexity score (0-1, where 1 is most complex)
+- key_concepts: List of 3-5 key concepts or themes
+- summary: Brief 2-3 sentence summary
+- language: Detected language (e.g., "English", "Spanish")
+"""
+
+PROCESS_PREFIX = """Analyze the following content in one pass: classify it according to the P.A.R.A methodology, generate smart tags, and provide insights.
+
+P.A.R.A Categories:
+1. 01-Projects: Tasks with clear deadlines and specific deliverables
+2. 02-Areas: Areas that need ongoing maintenance and management
+3. 03-Resources: Information that may be useful in the future
+4. 04-Archives: Completed projects or inactive areas
+
+"""
+
+PROCESS_SUFFIX = """
+Please respond with a single JSON object with exactly three keys:
+- classification: {category (01-Projects, 02-Areas, 03-Resources, 04-Archives), confidence (0-1), priority (urgent, important, normal), status (active, completed, on-hold), complexity (low, medium, high), estimated_time (e.g., "30 minutes", "2 hours", "1 day"), reasoning}
+- tags: {smart_tags (5-10 specific tags), confidence (0-1), semantic_groups (object grouping related tags, e.g., {"technical": ["api", "database"]}), related_topics (3-5 topics)}
+- analysis: {entities (important people, places, organizations, concepts), sentiment (positive, negative, neutral), complexity_score (0-1), key_concepts (3-5 themes), summary (2-3 sentences), language (e.g., "English")}
+"""
+
+def _anthropic_prompt_blocks(prompt: str, prefix: str) -> List[Dict]:
+    """정적 접두부를 cache_control 블록으로 분리 (Anthropic 프롬프트 캐싱)"""
+    if prompt.startswith(prefix):
+        return [
+            {"type": "text", "text": prefix, "cache_control": {"type": "ephemeral"}},
+            {"type": "text", "text": prompt[len(prefix):]}
+        ]
+    return [{"type": "text", "text": prompt}]
+
 # AI 서비스 함수
 class AIClassificationService:
+    prompt_prefix = CLASSIFY_PREFIX
+    system_prompt = SYSTEM_PARA
+    temperature = 0.3
+    # 요청마다 바뀌지 않는 메시지/페이로드 조각
+    _system_message = {"role": "system", "content": SYSTEM_PARA}
+    _perplexity_payload = {"model": PERPLEXITY_MODEL, "temperature": 0.3}
+    
     def __init__(self):
         self.primary_service = primary_ai_service
         self.fallback_service = fallback_ai_service
@@ -142,75 +723,107 @@ class AIClassificationService:
         
     async def classify_content(self, content: str, context: Optional[Dict] = None) -> ClassificationResponse:
         """AI와 P.A.R.A 방법론을 사용하여 콘텐츠 분류"""
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
+        cache_key = _cache_key(content)
+        cached = _CLASSIFY_CACHE.get(cache_key)
+        if cached is not None:
+            return cached
+        
+        return await _coalesce(_CLASSIFY_INFLIGHT, cache_key,
+                               lambda: self._classify_uncached(content, context, cache_key, start_ns))
+    
+    async def _classify_uncached(self, content: str, context: Optional[Dict],
+                                 cache_key: int, start_ns: int) -> ClassificationResponse:
+        """캐시 미스 시 DB 조회, 시맨틱 캐시, AI 호출 순으로 분류"""
         content_hash = generate_content_hash(content)
         
         # 분류가 이미 존재하는지 확인
-        existing_classification = db_manager.get_classification_history(content_hash)
+        existing_classification = await db_manager.get_classification_history(content_hash)
         if existing_classification:
-            logger.info(f"캐시된 분류 사용: {content_hash}")
-            return ClassificationResponse(
-                category=existing_classification['category'],
-                confidence=existing_classification['confidence'],
-                priority=existing_classification['priority'],
-                status=existing_classification['status'],
-                complexity=existing_classification['complexity'],
-                estimated_time=existing_classification['estimated_time'],
-                reasoning=existing_classification['reasoning']
-            )
+            logger.info("캐시된 분류 사용: %s", content_hash)
+            result = _CLASSIFY_ADAPTER.validate_python(existing_classification)
+            _CLASSIFY_CACHE[cache_key] = result
+            return result
+        
+        # 의미상 거의 같은 콘텐츠의 분류 재사용
+        embedding = await _embed_content(content, cache_key)
+        similar = _CLASSIFY_SEMANTIC.lookup(embedding)
+        if similar:
+            logger.info("시맨틱 캐시 분류 사용: %s", content_hash)
+            classification = dict(similar, reasoning=similar.get('reasoning', '') + " (semantic cache)")
+            processing_time = (time.perf_counter_ns() - start_ns) // 1_000_000
+            _spawn_write(content_hash, db_manager.save_classification(
+                content, classification, 'semantic_cache', processing_time,
+                content_hash=content_hash
+            ))
+            result = _CLASSIFY_ADAPTER.validate_python(classification)
+            _CLASSIFY_CACHE[cache_key] = result
+            return result
         
+        service = None
         try:
             # 프롬프트 준비
             prompt = self._create_classification_prompt(content, context)
             
             # 주 AI 서비스 먼저 시도
-            response = await self._call_ai_service(prompt, self.primary_service)
+            service = _provider_router.pick()
+            response = await self._call_ai_service(prompt, service)
             
             # 응답 파싱
             classification = self._parse_classification_response(response)
             
             # 데이터베이스에 저장
-            processing_time = int((time.time() - start_time) * 1000)
-            classification_id = db_manager.save_classification(
-                content, classification, self.primary_service, processing_time
-            )
+            processing_time = (time.perf_counter_ns() - start_ns) // 1_000_000
+            _spawn_write(content_hash, db_manager.save_classification(
+                content, classification, service, processing_time,
+                content_hash=content_hash
+            ))
             
             # AI 서비스 상태 업데이트
             db_manager.update_ai_service_status(
-                self.primary_service, 'active', processing_time, success_count=1
+                service, 'active', processing_time, success_count=1
             )
             
-            return ClassificationResponse(**classification)
+            result = _CLASSIFY_ADAPTER.validate_python(classification)
+            _CLASSIFY_CACHE[cache_key] = result
+            _CLASSIFY_SEMANTIC.add(embedding, classification)
+            return result
             
         except Exception as e:
-            logger.error(f"주 AI 서비스 오류: {str(e)}")
+            _log_sampled("classify:primary", "주 AI 서비스 오류: %s", e)
             try:
                 # 대체 AI 서비스 시도
-                response = await self._call_ai_service(prompt, self.fallback_service)
+                fallback = _provider_router.pick(exclude=service)
+                response = await self._call_ai_service(prompt, fallback)
                 classification = self._parse_classification_response(response)
                 
                 # 데이터베이스에 저장
-                processing_time = int((time.time() - start_time) * 1000)
-                classification_id = db_manager.save_classification(
-                    content, classification, self.fallback_service, processing_time
-                )
+                processing_time = (time.perf_counter_ns() - start_ns) // 1_000_000
+                _spawn_write(content_hash, db_manager.save_classification(
+                    content, classification, fallback, processing_time,
+                    content_hash=content_hash
+                ))
                 
                 # AI 서비스 상태 업데이트
                 db_manager.update_ai_service_status(
-                    self.fallback_service, 'active', processing_time, success_count=1
+                    fallback, 'active', processing_time, success_count=1
                 )
                 
-                return ClassificationResponse(**classification)
+                result = _CLASSIFY_ADAPTER.validate_python(classification)
+                _CLASSIFY_CACHE[cache_key] = result
+                _CLASSIFY_SEMANTIC.add(embedding, classification)
+                return result
             except Exception as fallback_error:
-                logger.error(f"대체 AI 서비스 오류: {str(fallback_error)}")
+                _log_sampled("classify:fallback", "대체 AI 서비스 오류: %s", fallback_error)
                 # 규칙 기반 분류로 대체
                 fallback_result = self._fallback_classification(content)
                 
                 # 대체 결과 저장
-                processing_time = int((time.time() - start_time) * 1000)
-                classification_id = db_manager.save_classification(
-                    content, fallback_result.dict(), 'fallback', processing_time
-                )
+                processing_time = (time.perf_counter_ns() - start_ns) // 1_000_000
+                _spawn_write(content_hash, db_manager.save_classification(
+                    content, fallback_result.dict(), 'fallback', processing_time,
+                    content_hash=content_hash
+                ))
                 
                 # AI 서비스 상태 업데이트
                 db_manager.update_ai_service_status(
@@ -219,134 +832,135 @@ class AIClassificationService:
                 
                 return fallback_result
     
+    async def classify_batch(self, items: List[ClassificationRequest]) -> List[ClassificationResponse]:
+        """여러 콘텐츠를 동시에 분류 (AI_CONCURRENCY로 동시 호출 수 제한)"""
+        semaphore = asyncio.Semaphore(ai_concurrency)
+        
+        async def _one(item: ClassificationRequest) -> ClassificationResponse:
+            async with semaphore:
+                return await self.classify_content(item.content, item.context)
+        
+        results = await asyncio.gather(*[_one(item) for item in items], return_exceptions=True)
+        
+        responses = []
+        for item, result in zip(items, results):
+            if isinstance(result, Exception):
+                logger.error("배치 분류 항목 오류: %s", result)
+                result = self._fallback_classification(item.content)
+            responses.append(result)
+        return responses
+    
     def _create_classification_prompt(self, content: str, context: Optional[Dict] = None) -> str:
         """OpenAI용 분류 프롬프트 생성"""
-        prompt = f"""
-        Analyze the following content and classify it according to the P.A.R.A methodology:
-        
-        Content: {content}
-        
-        Context: {context or "None"}
-        
-        P.A.R.A Categories:
-        1. 01-Projects: Tasks with clear deadlines and specific deliverables
-        2. 02-Areas: Areas that need ongoing maintenance and management
-        3. 03-Resources: Information that may be useful in the future
-        4. 04-Archives: Completed projects or inactive areas
-        
-        Please respond with a JSON object containing:
-        - category: The P.A.R.A category (01-Projects, 02-Areas, 03-Resources, 04-Archives)
-        - confidence: Confidence score (0-1)
-        - priority: Priority level (urgent, important, normal)
-        - status: Status (active, completed, on-hold)
-        - complexity: Complexity level (low, medium, high)
-        - estimated_time: Estimated time to complete/process (e.g., "30 minutes", "2 hours", "1 day")
-        - reasoning: Brief explanation of the classification decision
-        """
-        return prompt
+        return (CLASSIFY_PREFIX + _truncate(content, CLASSIFY_CONTENT_TOKENS)
+                + f"\nContext: {context or 'None'}\n" + CLASSIFY_SUFFIX)
     
     async def _call_ai_service(self, prompt: str, service: str) -> str:
-        """Call AI service based on configuration"""
+        """Call AI service based on configuration (identical prompts are served from the response cache)"""
+        cache_key = ResponseCache.make_key(service, type(self).__name__, prompt)
+        cached = await response_cache.get(cache_key)
+        if cached is not None:
+            return cached
+        
         if service == "anthropic":
-            return await self._call_anthropic(prompt)
+            response = await _provider_router.call(service, self._call_anthropic(prompt))
         elif service == "perplexity":
-            return await self._call_perplexity(prompt)
+            response = await _provider_router.call(service, self._call_perplexity(prompt))
         elif service == "openai":
-            return await self._call_openai(prompt)
+            response = await _provider_router.call(service, self._call_openai(prompt))
         else:
             raise ValueError(f"Unsupported AI service: {service}")
+        
+        # Only cache replies that contain a JSON object, so a malformed reply is retried next time
+        if _find_json_span(response):
+            await response_cache.set(cache_key, response)
+        return response
     
     async def _call_anthropic(self, prompt: str) -> str:
         """Anthropic Claude API 호출"""
         try:
-            response = anthropic_client.messages.create(
-                model="claude-3-5-sonnet-20241022",
+            async with anthropic_client.messages.stream(
+                model=ANTHROPIC_MODEL,
                 max_tokens=self.max_tokens,
-                temperature=0.3,
-                system="You are an expert in knowledge management and the P.A.R.A methodology. Provide accurate, structured responses.",
+                temperature=self.temperature,
+                system=self.system_prompt,
                 messages=[
-                    {"role": "user", "content": prompt}
+                    {"role": "user", "content": _anthropic_prompt_blocks(prompt, self.prompt_prefix)},
+                    # Prefill so the reply is a bare JSON object
+                    _ASSISTANT_PREFILL
                 ]
-            )
-            return response.content[0].text
+            ) as stream:
+                # 프리필 "{" 이후 텍스트를 객체가 닫힐 때까지만 수신
+                return await _read_json_stream(stream.text_stream, initial="{")
         except Exception as e:
-            logger.error(f"Anthropic API error: {str(e)}")
-            raise HTTPException(status_code=500, detail="Anthropic API temporarily unavailable")
+            raise _provider_error("anthropic", e) from e
     
     async def _call_perplexity(self, prompt: str) -> str:
         """Perplexity API 호출"""
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.post(
-                    "https://api.perplexity.ai/chat/completions",
-                    headers={
-                        "Authorization": f"Bearer {perplexity_api_key}",
-                        "Content-Type": "application/json"
-                    },
-                    json={
-                        "model": "llama-3.1-sonar-small-128k-online",
-                        "messages": [
-                            {"role": "system", "content": "You are an expert in knowledge management and the P.A.R.A methodology. Provide accurate, structured responses."},
-                            {"role": "user", "content": prompt}
-                        ],
-                        "max_tokens": self.max_tokens,
-                        "temperature": 0.3
-                    }
-                )
-                response.raise_for_status()
-                data = response.json()
-                return data["choices"][0]["message"]["content"]
+            return await _stream_perplexity({
+                **self._perplexity_payload,
+                "messages": [self._system_message, {"role": "user", "content": prompt}],
+                "max_tokens": self.max_tokens
+            })
         except Exception as e:
-            logger.error(f"Perplexity API error: {str(e)}")
-            raise HTTPException(status_code=500, detail="Perplexity API temporarily unavailable")
+            raise _provider_error("perplexity", e) from e
     
     async def _call_openai(self, prompt: str) -> str:
         """OpenAI API 호출"""
         try:
-            response = openai.ChatCompletion.create(
-                model="gpt-4",
-                messages=[
-                    {"role": "system", "content": "You are an expert in knowledge management and the P.A.R.A methodology. Provide accurate, structured responses."},
-                    {"role": "user", "content": prompt}
-                ],
+            if openai_client is None:
+                raise RuntimeError("OPENAI_API_KEY is not configured")
+            stream = await openai_client.chat.completions.create(
+                model=OPENAI_MODEL,
+                response_format=_JSON_RESPONSE_FORMAT,
+                messages=[self._system_message, {"role": "user", "content": prompt}],
                 max_tokens=self.max_tokens,
-                temperature=0.3
+                temperature=self.temperature,
+                stream=True
             )
-            return response.choices[0].message.content
+            try:
+                return await _read_json_stream(
+                    chunk.choices[0].delta.content async for chunk in stream if chunk.choices
+                )
+            finally:
+                # JSON 객체가 완성되면 남은 생성은 받지 않고 연결 종료
+                await stream.close()
         except Exception as e:
-            logger.error(f"OpenAI API error: {str(e)}")
-            raise HTTPException(status_code=500, detail="OpenAI API temporarily unavailable")
+            raise _provider_error("openai", e) from e
     
     def _parse_classification_response(self, response: str) -> Dict:
-        """OpenAI 응답 파싱"""
-        try:
-            # Extract JSON from response
-            import re
-            json_match = re.search(r'\{.*\}', response, re.DOTALL)
-            if json_match:
-                return json.loads(json_match.group())
-            else:
-                raise ValueError("No JSON found in response")
-        except Exception as e:
-            logger.error(f"Response parsing error: {str(e)}")
-            return self._fallback_classification_data()
+        """OpenAI 응답 파싱 (JSON이 없으면 예외: 호출자가 대체 제공자/규칙 기반으로 넘어가며 캐시하지 않음)"""
+        parsed = _loads_json_object(response)
+        if parsed is not None:
+            return parsed
+        
+        # Extract JSON from response
+        span = _find_json_span(response)
+        if not span:
+            raise ValueError("No JSON found in response")
+        return orjson.loads(response[span[0]:span[1]])
     
     def _fallback_classification(self, content: str) -> ClassificationResponse:
         """규칙 기반 분류로 대체"""
-        content_lower = content.lower()
-        
-        # Simple keyword-based classification
-        for category, rules in PARA_CLASSIFICATION_MODEL.items():
-            if any(keyword in content_lower for keyword in rules["keywords"]):
-                return ClassificationResponse(
-                    category=category,
-                    confidence=0.6,
-                    priority="normal",
-                    status="active",
-                    complexity="medium",
-                    estimated_time="1 hour",
-                    reasoning="Rule-based classification fallback"
-                )
+        # Keyword-based classification: one automaton pass, most hits wins
+        hits: Dict[str, int] = {}
+        for _, categories in _PARA_AC.iter(content.lower()):
+            for category in categories:
+                hits[category] = hits.get(category, 0) + 1
+        
+        if hits:
+            # Ties resolve in PARA_CLASSIFICATION_MODEL order
+            category = max(PARA_CLASSIFICATION_MODEL, key=lambda name: hits.get(name, 0))
+            return ClassificationResponse(
+                category=category,
+                confidence=0.6,
+                priority="normal",
+                status="active",
+                complexity="medium",
+                estimated_time="1 hour",
+                reasoning="Rule-based classification fallback"
+            )
         
         # Default to Areas
         return ClassificationResponse(
@@ -358,20 +972,15 @@ class AIClassificationService:
             estimated_time="1 hour",
             reasoning="Default classification to Areas"
         )
-    
-    def _fallback_classification_data(self) -> Dict:
-        """대체 분류 데이터"""
-        return {
-            "category": "02-Areas",
-            "confidence": 0.5,
-            "priority": "normal",
-            "status": "active",
-            "complexity": "medium",
-            "estimated_time": "1 hour",
-            "reasoning": "Fallback classification due to parsing error"
-        }
 
 class AITaggingService:
+    prompt_prefix = TAGGING_PREFIX
+    system_prompt = SYSTEM_TAGGER
+    temperature = 0.4
+    # 요청마다 바뀌지 않는 메시지/페이로드 조각
+    _system_message = {"role": "system", "content": SYSTEM_TAGGER}
+    _perplexity_payload = {"model": PERPLEXITY_MODEL, "temperature": 0.4}
+    
     def __init__(self):
         self.primary_service = primary_ai_service
         self.fallback_service = fallback_ai_service
@@ -380,66 +989,100 @@ class AITaggingService:
     async def generate_smart_tags(self, content: str, title: Optional[str] = None, 
                                 category: Optional[str] = None, analysis: Optional[Dict] = None) -> TaggingResponse:
         """Generate smart tags using AI"""
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
+        cache_key = _cache_key(content)
+        cached = _TAGGING_CACHE.get(cache_key)
+        if cached is not None:
+            return cached
+        
+        return await _coalesce(_TAGGING_INFLIGHT, cache_key,
+                               lambda: self._tag_uncached(content, title, category, analysis, cache_key, start_ns))
+    
+    async def _tag_uncached(self, content: str, title: Optional[str], category: Optional[str],
+                            analysis: Optional[Dict], cache_key: int, start_ns: int) -> TaggingResponse:
+        """Generate tags on an in-process cache miss"""
         content_hash = generate_content_hash(content)
         
         # Check if classification exists and has tags
-        existing_classification = db_manager.get_classification_history(content_hash)
+        await _wait_pending_write(content_hash)
+        existing_classification = await db_manager.get_classification_history(content_hash)
         if existing_classification and existing_classification.get('tags'):
-            logger.info(f"Using cached tags for content hash: {content_hash}")
+            logger.info("Using cached tags for content hash: %s", content_hash)
             tags = existing_classification['tags']
-            return TaggingResponse(
-                smart_tags=[tag['tag'] for tag in tags],
-                confidence=sum(tag['confidence'] for tag in tags) / len(tags) if tags else 0.5,
-                semantic_groups={tag['group']: [tag['tag']] for tag in tags},
-                related_topics=[]
-            )
+            result = _TAGGING_ADAPTER.validate_python({
+                'smart_tags': [tag['tag'] for tag in tags],
+                'confidence': sum(tag['confidence'] for tag in tags) / len(tags) if tags else 0.5,
+                'semantic_groups': {tag['group']: [tag['tag']] for tag in tags},
+                'related_topics': []
+            })
+            _TAGGING_CACHE[cache_key] = result
+            return result
         
+        embedding = await _embed_content(content, cache_key)
+        similar = _TAGGING_SEMANTIC.lookup(embedding)
+        if similar:
+            logger.info("Using semantic cache tags for content hash: %s", content_hash)
+            result = _TAGGING_ADAPTER.validate_python(similar)
+            _TAGGING_CACHE[cache_key] = result
+            return result
+        
+        service = None
         try:
             prompt = self._create_tagging_prompt(content, title, category, analysis)
-            response = await self._call_ai_service(prompt, self.primary_service)
+            service = _provider_router.pick()
+            response = await self._call_ai_service(prompt, service)
             tags_data = self._parse_tagging_response(response)
             
+            processing_time = (time.perf_counter_ns() - start_ns) // 1_000_000
+            
             # Save tags to database if classification exists
             if existing_classification:
-                processing_time = int((time.time() - start_time) * 1000)
-                db_manager.save_tags(
-                    existing_classification['id'], tags_data, self.primary_service, processing_time
+                await db_manager.save_tags(
+                    existing_classification['id'], tags_data, service, processing_time
                 )
             
             # Update AI service status
             db_manager.update_ai_service_status(
-                self.primary_service, 'active', int((time.time() - start_time) * 1000), success_count=1
+                service, 'active', processing_time, success_count=1
             )
             
-            return TaggingResponse(**tags_data)
+            result = _TAGGING_ADAPTER.validate_python(tags_data)
+            _TAGGING_CACHE[cache_key] = result
+            _TAGGING_SEMANTIC.add(embedding, tags_data)
+            return result
         except Exception as e:
-            logger.error(f"Primary AI service tagging error: {str(e)}")
+            _log_sampled("tagging:primary", "Primary AI service tagging error: %s", e)
             try:
-                response = await self._call_ai_service(prompt, self.fallback_service)
+                fallback = _provider_router.pick(exclude=service)
+                response = await self._call_ai_service(prompt, fallback)
                 tags_data = self._parse_tagging_response(response)
                 
+                processing_time = (time.perf_counter_ns() - start_ns) // 1_000_000
+                
                 # Save tags to database if classification exists
                 if existing_classification:
-                    processing_time = int((time.time() - start_time) * 1000)
-                    db_manager.save_tags(
-                        existing_classification['id'], tags_data, self.fallback_service, processing_time
+                    await db_manager.save_tags(
+                        existing_classification['id'], tags_data, fallback, processing_time
                     )
                 
                 # Update AI service status
                 db_manager.update_ai_service_status(
-                    self.fallback_service, 'active', int((time.time() - start_time) * 1000), success_count=1
+                    fallback, 'active', processing_time, success_count=1
                 )
                 
-                return TaggingResponse(**tags_data)
+                result = _TAGGING_ADAPTER.validate_python(tags_data)
+                _TAGGING_CACHE[cache_key] = result
+                _TAGGING_SEMANTIC.add(embedding, tags_data)
+                return result
             except Exception as fallback_error:
-                logger.error(f"Fallback AI service tagging error: {str(fallback_error)}")
+                _log_sampled("tagging:fallback", "Fallback AI service tagging error: %s", fallback_error)
                 fallback_result = self._fallback_tagging(content)
                 
+                processing_time = (time.perf_counter_ns() - start_ns) // 1_000_000
+                
                 # Save fallback tags if classification exists
                 if existing_classification:
-                    processing_time = int((time.time() - start_time) * 1000)
-                    db_manager.save_tags(
+                    await db_manager.save_tags(
                         existing_classification['id'], fallback_result.dict(), 'fallback', processing_time
                     )
                 
@@ -448,120 +1091,103 @@ class AITaggingService:
     def _create_tagging_prompt(self, content: str, title: Optional[str], 
                              category: Optional[str], analysis: Optional[Dict]) -> str:
         """Create tagging prompt for OpenAI"""
-        prompt = f"""
-        Generate smart tags for the following content:
-        
-        Title: {title or "No title"}
-        Content: {content[:500]}...
-        Category: {category or "Unknown"}
-        Analysis: {analysis or "None"}
-        
-        Please respond with a JSON object containing:
-        - smart_tags: List of 5-10 relevant, specific tags
-        - confidence: Confidence score (0-1)
-        - semantic_groups: Object grouping related tags (e.g., {{"technical": ["api", "database"], "business": ["strategy", "planning"]}})
-        - related_topics: List of 3-5 related topics for further exploration
-        
-        Focus on:
-        - Specific, actionable tags
-        - Technical terms when appropriate
-        - Business context
-        - Time sensitivity
-        - Complexity indicators
-        """
-        return prompt
+        return (TAGGING_PREFIX
+                + f"Title: {title or 'No title'}\n"
+                + f"Content: {_truncate(content, TAGGING_CONTENT_TOKENS)}...\n"
+                + f"Category: {category or 'Unknown'}\n"
+                + f"Analysis: {analysis or 'None'}\n"
+                + TAGGING_SUFFIX)
     
     async def _call_ai_service(self, prompt: str, service: str) -> str:
-        """Call AI service based on configuration"""
+        """Call AI service based on configuration (identical prompts are served from the response cache)"""
+        cache_key = ResponseCache.make_key(service, type(self).__name__, prompt)
+        cached = await response_cache.get(cache_key)
+        if cached is not None:
+            return cached
+        
         if service == "anthropic":
-            return await self._call_anthropic(prompt)
+            response = await _provider_router.call(service, self._call_anthropic(prompt))
         elif service == "perplexity":
-            return await self._call_perplexity(prompt)
+            response = await _provider_router.call(service, self._call_perplexity(prompt))
         elif service == "openai":
-            return await self._call_openai(prompt)
+            response = await _provider_router.call(service, self._call_openai(prompt))
         else:
             raise ValueError(f"Unsupported AI service: {service}")
+        
+        # Only cache replies that contain a JSON object, so a malformed reply is retried next time
+        if _find_json_span(response):
+            await response_cache.set(cache_key, response)
+        return response
     
     async def _call_anthropic(self, prompt: str) -> str:
         """Call Anthropic Claude API for tagging"""
         try:
-            response = anthropic_client.messages.create(
-                model="claude-3-5-sonnet-20241022",
+            async with anthropic_client.messages.stream(
+                model=ANTHROPIC_MODEL,
                 max_tokens=self.max_tokens,
-                temperature=0.4,
-                system="You are an expert in content tagging and knowledge organization. Generate precise, useful tags.",
+                temperature=self.temperature,
+                system=self.system_prompt,
                 messages=[
-                    {"role": "user", "content": prompt}
+                    {"role": "user", "content": _anthropic_prompt_blocks(prompt, self.prompt_prefix)},
+                    # Prefill so the reply is a bare JSON object
+                    _ASSISTANT_PREFILL
                 ]
-            )
-            return response.content[0].text
+            ) as stream:
+                # 프리필 "{" 이후 텍스트를 객체가 닫힐 때까지만 수신
+                return await _read_json_stream(stream.text_stream, initial="{")
         except Exception as e:
-            logger.error(f"Anthropic API error: {str(e)}")
-            raise HTTPException(status_code=500, detail="Anthropic API temporarily unavailable")
+            raise _provider_error("anthropic", e) from e
     
     async def _call_perplexity(self, prompt: str) -> str:
         """Call Perplexity API for tagging"""
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.post(
-                    "https://api.perplexity.ai/chat/completions",
-                    headers={
-                        "Authorization": f"Bearer {perplexity_api_key}",
-                        "Content-Type": "application/json"
-                    },
-                    json={
-                        "model": "llama-3.1-sonar-small-128k-online",
-                        "messages": [
-                            {"role": "system", "content": "You are an expert in content tagging and knowledge organization. Generate precise, useful tags."},
-                            {"role": "user", "content": prompt}
-                        ],
-                        "max_tokens": self.max_tokens,
-                        "temperature": 0.4
-                    }
-                )
-                response.raise_for_status()
-                data = response.json()
-                return data["choices"][0]["message"]["content"]
+            return await _stream_perplexity({
+                **self._perplexity_payload,
+                "messages": [self._system_message, {"role": "user", "content": prompt}],
+                "max_tokens": self.max_tokens
+            })
         except Exception as e:
-            logger.error(f"Perplexity API error: {str(e)}")
-            raise HTTPException(status_code=500, detail="Perplexity API temporarily unavailable")
+            raise _provider_error("perplexity", e) from e
     
     async def _call_openai(self, prompt: str) -> str:
         """Call OpenAI API for tagging"""
         try:
-            response = openai.ChatCompletion.create(
-                model="gpt-4",
-                messages=[
-                    {"role": "system", "content": "You are an expert in content tagging and knowledge organization. Generate precise, useful tags."},
-                    {"role": "user", "content": prompt}
-                ],
+            if openai_client is None:
+                raise RuntimeError("OPENAI_API_KEY is not configured")
+            stream = await openai_client.chat.completions.create(
+                model=OPENAI_MODEL,
+                response_format=_JSON_RESPONSE_FORMAT,
+                messages=[self._system_message, {"role": "user", "content": prompt}],
                 max_tokens=self.max_tokens,
-                temperature=0.4
+                temperature=self.temperature,
+                stream=True
             )
-            return response.choices[0].message.content
+            try:
+                return await _read_json_stream(
+                    chunk.choices[0].delta.content async for chunk in stream if chunk.choices
+                )
+            finally:
+                # JSON 객체가 완성되면 남은 생성은 받지 않고 연결 종료
+                await stream.close()
         except Exception as e:
-            logger.error(f"OpenAI API error: {str(e)}")
-            raise HTTPException(status_code=500, detail="AI service temporarily unavailable")
+            raise _provider_error("openai", e) from e
     
     def _parse_tagging_response(self, response: str) -> Dict:
-        """Parse tagging response"""
-        try:
-            import re
-            json_match = re.search(r'\{.*\}', response, re.DOTALL)
-            if json_match:
-                return json.loads(json_match.group())
-            else:
-                raise ValueError("No JSON found in response")
-        except Exception as e:
-            logger.error(f"Tagging response parsing error: {str(e)}")
-            return self._fallback_tagging_data()
+        """Parse tagging response (raises if there is no JSON, so nothing degraded is cached)"""
+        parsed = _loads_json_object(response)
+        if parsed is not None:
+            return parsed
+        
+        span = _find_json_span(response)
+        if not span:
+            raise ValueError("No JSON found in response")
+        return orjson.loads(response[span[0]:span[1]])
     
     def _fallback_tagging(self, content: str) -> TaggingResponse:
         """Fallback tagging based on content analysis"""
         # Simple keyword extraction
         words = content.lower().split()
-        common_words = {"the", "a", "an", "and", "or", "but", "in", "on", "at", "to", "for", "of", "with", "by"}
-        unique_words = [word for word in words if word not in common_words and len(word) > 3]
+        unique_words = [word for word in words if word not in _TAGGING_STOPWORDS and len(word) > 3]
         
         return TaggingResponse(
             smart_tags=unique_words[:5],
@@ -569,17 +1195,15 @@ class AITaggingService:
             semantic_groups={"general": unique_words[:3]},
             related_topics=["content analysis", "knowledge management"]
         )
-    
-    def _fallback_tagging_data(self) -> Dict:
-        """Fallback tagging data"""
-        return {
-            "smart_tags": ["content", "analysis", "knowledge"],
-            "confidence": 0.3,
-            "semantic_groups": {"general": ["content", "analysis"]},
-            "related_topics": ["knowledge management"]
-        }
 
 class AIAnalysisService:
+    prompt_prefix = ANALYSIS_PREFIX
+    system_prompt = SYSTEM_ANALYST
+    temperature = 0.2
+    # 요청마다 바뀌지 않는 메시지/페이로드 조각
+    _system_message = {"role": "system", "content": SYSTEM_ANALYST}
+    _perplexity_payload = {"model": PERPLEXITY_MODEL, "temperature": 0.2}
+    
     def __init__(self):
         self.primary_service = primary_ai_service
         self.fallback_service = fallback_ai_service
@@ -588,68 +1212,94 @@ class AIAnalysisService:
     async def analyze_content(self, content: str, title: Optional[str] = None, 
                             context: Optional[Dict] = None) -> AnalysisResponse:
         """Analyze content for insights"""
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
+        cache_key = _cache_key(content)
+        cached = _ANALYSIS_CACHE.get(cache_key)
+        if cached is not None:
+            return cached
+        
+        return await _coalesce(_ANALYSIS_INFLIGHT, cache_key,
+                               lambda: self._analyze_uncached(content, title, context, cache_key, start_ns))
+    
+    async def _analyze_uncached(self, content: str, title: Optional[str], context: Optional[Dict],
+                                cache_key: int, start_ns: int) -> AnalysisResponse:
+        """Analyze content on an in-process cache miss"""
         content_hash = generate_content_hash(content)
         
         # Check if classification exists and has analysis
-        existing_classification = db_manager.get_classification_history(content_hash)
+        await _wait_pending_write(content_hash)
+        existing_classification = await db_manager.get_classification_history(content_hash)
         if existing_classification and existing_classification.get('analysis'):
-            logger.info(f"Using cached analysis for content hash: {content_hash}")
-            analysis = existing_classification['analysis']
-            return AnalysisResponse(
-                entities=analysis['entities'],
-                sentiment=analysis['sentiment'],
-                complexity_score=analysis['complexity_score'],
-                key_concepts=analysis['key_concepts'],
-                summary=analysis['summary'],
-                language=analysis['language']
-            )
+            logger.info("Using cached analysis for content hash: %s", content_hash)
+            result = _ANALYSIS_ADAPTER.validate_python(existing_classification['analysis'])
+            _ANALYSIS_CACHE[cache_key] = result
+            return result
+        
+        embedding = await _embed_content(content, cache_key)
+        similar = _ANALYSIS_SEMANTIC.lookup(embedding)
+        if similar:
+            logger.info("Using semantic cache analysis for content hash: %s", content_hash)
+            result = _ANALYSIS_ADAPTER.validate_python(similar)
+            _ANALYSIS_CACHE[cache_key] = result
+            return result
         
+        service = None
         try:
             prompt = self._create_analysis_prompt(content, title, context)
-            response = await self._call_ai_service(prompt, self.primary_service)
+            service = _provider_router.pick()
+            response = await self._call_ai_service(prompt, service)
             analysis_data = self._parse_analysis_response(response)
             
+            processing_time = (time.perf_counter_ns() - start_ns) // 1_000_000
+            
             # Save analysis to database if classification exists
             if existing_classification:
-                processing_time = int((time.time() - start_time) * 1000)
-                db_manager.save_analysis(
-                    existing_classification['id'], analysis_data, self.primary_service, processing_time
+                await db_manager.save_analysis(
+                    existing_classification['id'], analysis_data, service, processing_time
                 )
             
             # Update AI service status
             db_manager.update_ai_service_status(
-                self.primary_service, 'active', int((time.time() - start_time) * 1000), success_count=1
+                service, 'active', processing_time, success_count=1
             )
             
-            return AnalysisResponse(**analysis_data)
+            result = _ANALYSIS_ADAPTER.validate_python(analysis_data)
+            _ANALYSIS_CACHE[cache_key] = result
+            _ANALYSIS_SEMANTIC.add(embedding, analysis_data)
+            return result
         except Exception as e:
-            logger.error(f"Primary AI service analysis error: {str(e)}")
+            _log_sampled("analysis:primary", "Primary AI service analysis error: %s", e)
             try:
-                response = await self._call_ai_service(prompt, self.fallback_service)
+                fallback = _provider_router.pick(exclude=service)
+                response = await self._call_ai_service(prompt, fallback)
                 analysis_data = self._parse_analysis_response(response)
                 
+                processing_time = (time.perf_counter_ns() - start_ns) // 1_000_000
+                
                 # Save analysis to database if classification exists
                 if existing_classification:
-                    processing_time = int((time.time() - start_time) * 1000)
-                    db_manager.save_analysis(
-                        existing_classification['id'], analysis_data, self.fallback_service, processing_time
+                    await db_manager.save_analysis(
+                        existing_classification['id'], analysis_data, fallback, processing_time
                     )
                 
                 # Update AI service status
                 db_manager.update_ai_service_status(
-                    self.fallback_service, 'active', int((time.time() - start_time) * 1000), success_count=1
+                    fallback, 'active', processing_time, success_count=1
                 )
                 
-                return AnalysisResponse(**analysis_data)
+                result = _ANALYSIS_ADAPTER.validate_python(analysis_data)
+                _ANALYSIS_CACHE[cache_key] = result
+                _ANALYSIS_SEMANTIC.add(embedding, analysis_data)
+                return result
             except Exception as fallback_error:
-                logger.error(f"Fallback AI service analysis error: {str(fallback_error)}")
+                _log_sampled("analysis:fallback", "Fallback AI service analysis error: %s", fallback_error)
                 fallback_result = self._fallback_analysis(content)
                 
+                processing_time = (time.perf_counter_ns() - start_ns) // 1_000_000
+                
                 # Save fallback analysis if classification exists
                 if existing_classification:
-                    processing_time = int((time.time() - start_time) * 1000)
-                    db_manager.save_analysis(
+                    await db_manager.save_analysis(
                         existing_classification['id'], fallback_result.dict(), 'fallback', processing_time
                     )
                 
@@ -657,107 +1307,98 @@ class AIAnalysisService:
     
     def _create_analysis_prompt(self, content: str, title: Optional[str], context: Optional[Dict]) -> str:
         """Create analysis prompt for OpenAI"""
-        prompt = f"""
-        Analyze the following content and provide insights:
-        
-        Title: {title or "No title"}
-        Content: {content[:1000]}...
-        Context: {context or "None"}
-        
-        Please respond with a JSON object containing:
-        - entities: List of important entities (people, places, organizations, concepts)
-        - sentiment: Overall sentiment (positive, negative, neutral)
-        - complexity_score: Complexity score (0-1, where 1 is most complex)
-        - key_concepts: List of 3-5 key concepts or themes
-        - summary: Brief 2-3 sentence summary
-        - language: Detected language (e.g., "English", "Spanish")
-        """
-        return prompt
+        return (ANALYSIS_PREFIX
+                + f"Title: {title or 'No title'}\n"
+                + f"Content: {_truncate(content, ANALYSIS_CONTENT_TOKENS)}...\n"
+                + f"Context: {context or 'None'}\n"
+                + ANALYSIS_SUFFIX)
     
     async def _call_ai_service(self, prompt: str, service: str) -> str:
-        """Call AI service based on configuration"""
+        """Call AI service based on configuration (identical prompts are served from the response cache)"""
+        cache_key = ResponseCache.make_key(service, type(self).__name__, prompt)
+        cached = await response_cache.get(cache_key)
+        if cached is not None:
+            return cached
+        
         if service == "anthropic":
-            return await self._call_anthropic(prompt)
+            response = await _provider_router.call(service, self._call_anthropic(prompt))
         elif service == "perplexity":
-            return await self._call_perplexity(prompt)
+            response = await _provider_router.call(service, self._call_perplexity(prompt))
         elif service == "openai":
-            return await self._call_openai(prompt)
+            response = await _provider_router.call(service, self._call_openai(prompt))
         else:
             raise ValueError(f"Unsupported AI service: {service}")
+        
+        # Only cache replies that contain a JSON object, so a malformed reply is retried next time
+        if _find_json_span(response):
+            await response_cache.set(cache_key, response)
+        return response
     
     async def _call_anthropic(self, prompt: str) -> str:
         """Call Anthropic Claude API for analysis"""
         try:
-            response = anthropic_client.messages.create(
-                model="claude-3-5-sonnet-20241022",
+            async with anthropic_client.messages.stream(
+                model=ANTHROPIC_MODEL,
                 max_tokens=self.max_tokens,
-                temperature=0.2,
-                system="You are an expert content analyst. Provide detailed, accurate analysis.",
+                temperature=self.temperature,
+                system=self.system_prompt,
                 messages=[
-                    {"role": "user", "content": prompt}
+                    {"role": "user", "content": _anthropic_prompt_blocks(prompt, self.prompt_prefix)},
+                    # Prefill so the reply is a bare JSON object
+                    _ASSISTANT_PREFILL
                 ]
-            )
-            return response.content[0].text
+            ) as stream:
+                # 프리필 "{" 이후 텍스트를 객체가 닫힐 때까지만 수신
+                return await _read_json_stream(stream.text_stream, initial="{")
         except Exception as e:
-            logger.error(f"Anthropic API error: {str(e)}")
-            raise HTTPException(status_code=500, detail="Anthropic API temporarily unavailable")
+            raise _provider_error("anthropic", e) from e
     
     async def _call_perplexity(self, prompt: str) -> str:
         """Call Perplexity API for analysis"""
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.post(
-                    "https://api.perplexity.ai/chat/completions",
-                    headers={
-                        "Authorization": f"Bearer {perplexity_api_key}",
-                        "Content-Type": "application/json"
-                    },
-                    json={
-                        "model": "llama-3.1-sonar-small-128k-online",
-                        "messages": [
-                            {"role": "system", "content": "You are an expert content analyst. Provide detailed, accurate analysis."},
-                            {"role": "user", "content": prompt}
-                        ],
-                        "max_tokens": self.max_tokens,
-                        "temperature": 0.2
-                    }
-                )
-                response.raise_for_status()
-                data = response.json()
-                return data["choices"][0]["message"]["content"]
+            return await _stream_perplexity({
+                **self._perplexity_payload,
+                "messages": [self._system_message, {"role": "user", "content": prompt}],
+                "max_tokens": self.max_tokens
+            })
         except Exception as e:
-            logger.error(f"Perplexity API error: {str(e)}")
-            raise HTTPException(status_code=500, detail="Perplexity API temporarily unavailable")
+            raise _provider_error("perplexity", e) from e
     
     async def _call_openai(self, prompt: str) -> str:
         """Call OpenAI API for analysis"""
         try:
-            response = openai.ChatCompletion.create(
-                model="gpt-4",
-                messages=[
-                    {"role": "system", "content": "You are an expert content analyst. Provide detailed, accurate analysis."},
-                    {"role": "user", "content": prompt}
-                ],
+            if openai_client is None:
+                raise RuntimeError("OPENAI_API_KEY is not configured")
+            stream = await openai_client.chat.completions.create(
+                model=OPENAI_MODEL,
+                response_format=_JSON_RESPONSE_FORMAT,
+                messages=[self._system_message, {"role": "user", "content": prompt}],
                 max_tokens=self.max_tokens,
-                temperature=0.2
+                temperature=self.temperature,
+                stream=True
             )
-            return response.choices[0].message.content
+            try:
+                return await _read_json_stream(
+                    chunk.choices[0].delta.content async for chunk in stream if chunk.choices
+                )
+            finally:
+                # JSON 객체가 완성되면 남은 생성은 받지 않고 연결 종료
+                await stream.close()
         except Exception as e:
-            logger.error(f"OpenAI API error: {str(e)}")
-            raise HTTPException(status_code=500, detail="AI service temporarily unavailable")
+            raise _provider_error("openai", e) from e
     
     def _parse_analysis_response(self, response: str) -> Dict:
-        """Parse analysis response"""
+        """Parse analysis response (raises if there is no JSON, so nothing degraded is cached)"""
+        # Typed fast path: a bare, well-formed analysis object
         try:
-            import re
-            json_match = re.search(r'\{.*\}', response, re.DOTALL)
-            if json_match:
-                return json.loads(json_match.group())
-            else:
-                raise ValueError("No JSON found in response")
-        except Exception as e:
-            logger.error(f"Analysis response parsing error: {str(e)}")
-            return self._fallback_analysis_data()
+            return msgspec.structs.asdict(_ANALYSIS_DECODER.decode(response))
+        except msgspec.DecodeError:
+            pass
+        
+        span = _find_json_span(response)
+        if not span:
+            raise ValueError("No JSON found in response")
+        return orjson.loads(response[span[0]:span[1]])
     
     def _fallback_analysis(self, content: str) -> AnalysisResponse:
         """Fallback analysis"""
@@ -769,44 +1410,183 @@ class AIAnalysisService:
             summary="Content analysis completed with basic processing.",
             language="English"
         )
+
+class AIProcessingService(AIClassificationService):
+    """분류, 태깅, 분석을 한 번의 AI 호출로 처리 (제공자 호출 메서드는 분류 서비스에서 상속)"""
+    prompt_prefix = PROCESS_PREFIX
     
-    def _fallback_analysis_data(self) -> Dict:
-        """Fallback analysis data"""
-        return {
-            "entities": ["content"],
-            "sentiment": "neutral",
-            "complexity_score": 0.5,
-            "key_concepts": ["knowledge", "management"],
-            "summary": "Basic content analysis completed.",
-            "language": "English"
-        }
+    def __init__(self, tagger: AITaggingService, analyzer: AIAnalysisService):
+        super().__init__()
+        self.max_tokens = 2000
+        self.tagger = tagger
+        self.analyzer = analyzer
+    
+    async def process_content(self, content: str, title: Optional[str] = None,
+                              context: Optional[Dict] = None) -> ProcessResponse:
+        """새 콘텐츠의 분류/태그/분석을 단일 호출로 생성하고 개별 캐시도 채움"""
+        start_ns = time.perf_counter_ns()
+        cache_key = _cache_key(content)
+        classification = _CLASSIFY_CACHE.get(cache_key)
+        tags = _TAGGING_CACHE.get(cache_key)
+        analysis = _ANALYSIS_CACHE.get(cache_key)
+        if classification is not None and tags is not None and analysis is not None:
+            return ProcessResponse(classification=classification, tags=tags, analysis=analysis,
+                                   content_hash=generate_content_hash(content))
+        
+        return await _coalesce(_PROCESS_INFLIGHT, cache_key,
+                               lambda: self._process_uncached(content, title, context, cache_key, start_ns))
+    
+    async def _process_uncached(self, content: str, title: Optional[str], context: Optional[Dict],
+                                cache_key: int, start_ns: int) -> ProcessResponse:
+        content_hash = generate_content_hash(content)
+        
+        # 세 결과가 모두 저장되어 있으면 그대로 사용
+        await _wait_pending_write(content_hash)
+        existing = await db_manager.get_classification_history(content_hash)
+        if existing and existing.get('tags') and existing.get('analysis'):
+            logger.info("캐시된 통합 처리 결과 사용: %s", content_hash)
+            tags = existing['tags']
+            result = ProcessResponse(
+                classification=_CLASSIFY_ADAPTER.validate_python(existing),
+                tags=_TAGGING_ADAPTER.validate_python({
+                    'smart_tags': [tag['tag'] for tag in tags],
+                    'confidence': sum(tag['confidence'] for tag in tags) / len(tags),
+                    'semantic_groups': {tag['group']: [tag['tag']] for tag in tags},
+                    'related_topics': []
+                }),
+                analysis=_ANALYSIS_ADAPTER.validate_python(existing['analysis']),
+                content_hash=content_hash
+            )
+            self._remember(cache_key, result)
+            return result
+        
+        prompt = self._create_process_prompt(content, title, context)
+        service = None
+        try:
+            service = _provider_router.pick()
+            data = self._parse_process_response(await self._call_ai_service(prompt, service))
+        except Exception as e:
+            _log_sampled("process:primary", "통합 처리 주 AI 서비스 오류: %s", e)
+            try:
+                service = _provider_router.pick(exclude=service)
+                data = self._parse_process_response(await self._call_ai_service(prompt, service))
+            except Exception as fallback_error:
+                _log_sampled("process:fallback", "통합 처리 대체 AI 서비스 오류: %s", fallback_error)
+                data = None
+        
+        processing_time = (time.perf_counter_ns() - start_ns) // 1_000_000
+        if data is None:
+            # 규칙 기반 결과로 대체 (캐시하지 않음)
+            result = ProcessResponse(
+                classification=self._fallback_classification(content),
+                tags=self.tagger._fallback_tagging(content),
+                analysis=self.analyzer._fallback_analysis(content),
+                content_hash=content_hash
+            )
+            _spawn_write(content_hash, self._save_all(content, content_hash, result, 'fallback', processing_time))
+            return result
+        
+        result = ProcessResponse(
+            classification=_CLASSIFY_ADAPTER.validate_python(data['classification']),
+            tags=_TAGGING_ADAPTER.validate_python(data['tags']),
+            analysis=_ANALYSIS_ADAPTER.validate_python(data['analysis']),
+            content_hash=content_hash
+        )
+        db_manager.update_ai_service_status(service, 'active', processing_time, success_count=1)
+        _spawn_write(content_hash, self._save_all(content, content_hash, result, service, processing_time))
+        self._remember(cache_key, result)
+        return result
+    
+    def _create_process_prompt(self, content: str, title: Optional[str], context: Optional[Dict]) -> str:
+        """통합 처리 프롬프트 생성"""
+        return (PROCESS_PREFIX
+                + f"Title: {title or 'No title'}\n"
+                + f"Content: {_truncate(content, CLASSIFY_CONTENT_TOKENS)}\n"
+                + f"Context: {context or 'None'}\n"
+                + PROCESS_SUFFIX)
+    
+    def _parse_process_response(self, response: str) -> Dict:
+        """세 섹션을 가진 JSON 응답 파싱 (섹션이 없으면 예외)"""
+        data = _loads_json_object(response)
+        if data is None:
+            span = _find_json_span(response)
+            if not span:
+                raise ValueError("No JSON found in response")
+            data = orjson.loads(response[span[0]:span[1]])
+        for section in ('classification', 'tags', 'analysis'):
+            if not isinstance(data.get(section), dict):
+                raise ValueError(f"Missing '{section}' section in response")
+        return data
+    
+    def _remember(self, cache_key: int, result: ProcessResponse) -> None:
+        """개별 엔드포인트가 같은 콘텐츠를 받으면 캐시에서 바로 응답하도록 저장"""
+        _CLASSIFY_CACHE[cache_key] = result.classification
+        _TAGGING_CACHE[cache_key] = result.tags
+        _ANALYSIS_CACHE[cache_key] = result.analysis
+    
+    async def _save_all(self, content: str, content_hash: str, result: ProcessResponse,
+                        service: str, processing_time: int) -> None:
+        """분류 저장 후 태그와 분석을 동시에 저장"""
+        classification_id = await db_manager.save_classification(
+            content, result.classification.dict(), service, processing_time,
+            content_hash=content_hash
+        )
+        await asyncio.gather(
+            db_manager.save_tags(classification_id, result.tags.dict(), service, processing_time),
+            db_manager.save_analysis(classification_id, result.analysis.dict(), service, processing_time)
+        )
+
+# 서비스 의존성 (인스턴스는 시작 시 한 번 생성되어 app.state에 보관)
+def get_classifier(req: Request) -> AIClassificationService:
+    return req.app.state.classifier
 
-# 서비스 초기화
-classification_service = AIClassificationService()
-tagging_service = AITaggingService()
-analysis_service = AIAnalysisService()
+def get_tagger(req: Request) -> AITaggingService:
+    return req.app.state.tagger
+
+def get_analyzer(req: Request) -> AIAnalysisService:
+    return req.app.state.analyzer
+
+def get_processor(req: Request) -> AIProcessingService:
+    return req.app.state.processor
+
+# 헬스 체크는 모니터링이 자주 호출하므로 ISO 타임스탬프를 초 단위로만 새로 만듦
+@lru_cache(maxsize=1)
+def _iso_timestamp(second: int) -> str:
+    return datetime.fromtimestamp(second).isoformat()
 
 # API 엔드포인트
 @app.get("/health")
 async def health_check():
     """헬스 체크 엔드포인트"""
-    return {"status": "healthy", "timestamp": datetime.now().isoformat()}
+    return {"status": "healthy", "timestamp": _iso_timestamp(int(time.time()))}
 
 @app.post("/api/classify", response_model=ClassificationResponse)
-async def classify_content(request: ClassificationRequest):
+async def classify_content(request: ClassificationRequest,
+                           classifier: AIClassificationService = Depends(get_classifier)):
     """AI와 P.A.R.A 방법론을 사용하여 콘텐츠 분류"""
     try:
-        result = await classification_service.classify_content(request.content, request.context)
+        result = await classifier.classify_content(request.content, request.context)
         return result
     except Exception as e:
-        logger.error(f"Classification endpoint error: {str(e)}")
+        logger.error("Classification endpoint error: %s", e)
+        raise HTTPException(status_code=500, detail=str(e))
+
+@app.post("/api/classify/batch", response_model=List[ClassificationResponse])
+async def classify_batch(requests: List[ClassificationRequest],
+                         classifier: AIClassificationService = Depends(get_classifier)):
+    """여러 콘텐츠를 동시에 분류"""
+    try:
+        return await classifier.classify_batch(requests)
+    except Exception as e:
+        logger.error("Batch classification endpoint error: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.post("/api/tag", response_model=TaggingResponse)
-async def generate_tags(request: TaggingRequest):
+async def generate_tags(request: TaggingRequest,
+                        tagger: AITaggingService = Depends(get_tagger)):
     """콘텐츠용 스마트 태그 생성"""
     try:
-        result = await tagging_service.generate_smart_tags(
+        result = await tagger.generate_smart_tags(
             request.content, 
             request.title, 
             request.category, 
@@ -814,36 +1594,40 @@ async def generate_tags(request: TaggingRequest):
         )
         return result
     except Exception as e:
-        logger.error(f"Tagging endpoint error: {str(e)}")
+        logger.error("Tagging endpoint error: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.post("/api/analyze", response_model=AnalysisResponse)
-async def analyze_content(request: AnalysisRequest):
+async def analyze_content(request: AnalysisRequest,
+                          analyzer: AIAnalysisService = Depends(get_analyzer)):
     """콘텐츠 인사이트 분석"""
     try:
-        result = await analysis_service.analyze_content(
+        result = await analyzer.analyze_content(
             request.content, 
             request.title, 
             request.context
         )
         return result
     except Exception as e:
-        logger.error(f"Analysis endpoint error: {str(e)}")
+        logger.error("Analysis endpoint error: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
+# 설정은 프로세스 수명 동안 바뀌지 않으므로 한 번만 구성 (라우팅 상태만 요청마다 갱신)
+_MODELS_STATUS: Final = {
+    "classification": "active",
+    "tagging": "active",
+    "analysis": "active",
+    "primary_service": primary_ai_service,
+    "fallback_service": fallback_ai_service,
+    "openai_status": "connected" if openai_client is not None else "disconnected",
+    "anthropic_status": "connected" if os.getenv("ANTHROPIC_API_KEY") else "disconnected",
+    "perplexity_status": "connected" if perplexity_api_key else "disconnected"
+}
+
 @app.get("/api/models/status")
 async def get_models_status():
     """AI 모델 상태 조회"""
-    return {
-        "classification": "active",
-        "tagging": "active", 
-        "analysis": "active",
-        "primary_service": primary_ai_service,
-        "fallback_service": fallback_ai_service,
-        "openai_status": "connected" if openai.api_key else "disconnected",
-        "anthropic_status": "connected" if os.getenv("ANTHROPIC_API_KEY") else "disconnected",
-        "perplexity_status": "connected" if os.getenv("PERPLEXITY_API_KEY") else "disconnected"
-    }
+    return {**_MODELS_STATUS, "routing": _provider_router.snapshot()}
 
 @app.get("/api/database/health")
 async def database_health():
@@ -853,51 +1637,55 @@ async def database_health():
 @app.get("/api/database/stats")
 async def database_stats():
     """데이터베이스 통계 조회"""
-    return db_manager.get_statistics()
+    return await asyncio.get_running_loop().run_in_executor(None, db_manager.get_statistics)
 
 @app.get("/api/classification/history/{content_hash}")
 async def get_classification_history(content_hash: str):
     """콘텐츠 분류 히스토리 조회"""
-    result = db_manager.get_classification_history(content_hash)
+    await _wait_pending_write(content_hash)
+    result = await db_manager.get_classification_history(content_hash)
     if not result:
         raise HTTPException(status_code=404, detail="Classification not found")
     return result
 
+@app.post("/api/process", response_model=ProcessResponse)
+async def process_content(request: ProcessRequest,
+                          processor: AIProcessingService = Depends(get_processor)):
+    """새 콘텐츠를 한 번의 AI 호출로 분류, 태깅, 분석"""
+    try:
+        return await processor.process_content(request.content, request.title, request.context)
+    except Exception as e:
+        logger.error("Process endpoint error: %s", e)
+        raise HTTPException(status_code=500, detail=str(e))
+
 @app.post("/api/classification/complete")
-async def complete_classification(request: ClassificationRequest):
-    """모든 AI 서비스로 완전한 분류 수행 (분류, 태깅, 분석)"""
+async def complete_classification(request: ClassificationRequest,
+                                  processor: AIProcessingService = Depends(get_processor)):
+    """모든 AI 서비스로 완전한 분류 수행 (분류, 태깅, 분석을 한 번의 AI 호출로)"""
     try:
-        # 콘텐츠 분류
-        classification_result = await classification_service.classify_content(request.content, request.context)
+        result = await processor.process_content(request.content, context=request.context)
         
-        # 태그 생성
-        tagging_result = await tagging_service.generate_smart_tags(
-            request.content, 
-            category=classification_result.category,
-            analysis={"confidence": classification_result.confidence}
-        )
-        
-        # 콘텐츠 분석
-        analysis_result = await analysis_service.analyze_content(
-            request.content,
-            context=request.context
-        )
-        
-        return {
-            "classification": classification_result,
-            "tags": tagging_result,
-            "analysis": analysis_result,
-            "content_hash": generate_content_hash(request.content)
-        }
+        # 미리 dict로 변환해 바로 orjson 직렬화 (jsonable_encoder 재순회 생략)
+        return ORJSONResponse(result.dict())
     except Exception as e:
-        logger.error(f"Complete classification error: {str(e)}")
+        logger.error("Complete classification error: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
 if __name__ == "__main__":
+    # 자동 리로드는 개발 모드(ENV=dev)에서만; 운영은 멀티 워커
+    # loop/http "auto": 설치돼 있으면 uvloop/httptools 사용 (Windows에는 uvloop 없음)
+    # 워커별 상태: 결과/히스토리 캐시, 진행 중 호출 합치기, 대기 중 저장 추적은 프로세스마다 따로임.
+    # 다른 워커가 방금 쓴 분류는 HISTORY_CACHE_TTL / RESULT_CACHE_TTL 동안 이전 값으로 보일 수 있음
+    # (제공자 응답 캐시만 Redis로 공유). 읽기 후 즉시 일관성이 필요하면 WORKERS=1로 실행.
+    dev_mode = os.getenv("ENV", "production").lower() == "dev"
     uvicorn.run(
         "main:app",
-        host="0.0.0.0",
-        port=8000,
-        reload=True,
-        log_level="info"
+        host=os.getenv("AI_SERVICE_HOST", "0.0.0.0"),
+        port=int(os.getenv("AI_SERVICE_PORT", "8000")),
+        reload=dev_mode,
+        workers=1 if dev_mode else int(os.getenv("WORKERS", str(os.cpu_count() or 1))),
+        loop="auto",
+        http="auto",
+        log_level="info",
+        access_log=dev_mode
     )
@@ -87,9 +87,9 @@ def upgrade() -> None:
         sa.Column('created_at', sa.DateTime(), nullable=False),
         sa.PrimaryKeyConstraint('id')
     )
-    op.create_index('idx_content_hash', 'processing_logs', ['content_hash'], unique=False)
+    op.create_index('idx_pl_content_hash', 'processing_logs', ['content_hash'], unique=False)
     op.create_index('idx_processing_type_status', 'processing_logs', ['processing_type', 'status'], unique=False)
-    op.create_index('idx_created_at', 'processing_logs', ['created_at'], unique=False)
+    op.create_index('idx_pl_created_at', 'processing_logs', ['created_at'], unique=False)
     op.create_index('idx_processing_time', 'processing_logs', ['processing_time_ms'], unique=False)
 
     # Create system_metrics table
@@ -0,0 +1,24 @@
+"""Add unique constraint on content_classifications.content_hash
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-15 09:00:00.000000
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '0002'
+down_revision = '0001'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # content_hash is the upsert key for save_classification (ON CONFLICT)
+    op.create_unique_constraint('uq_cc_content_hash', 'content_classifications', ['content_hash'])
+
+
+def downgrade() -> None:
+    op.drop_constraint('uq_cc_content_hash', 'content_classifications', type_='unique')
@@ -0,0 +1,119 @@
+"""Partition processing_logs and system_metrics by month
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-15 10:00:00.000000
+
+"""
+from datetime import datetime, timedelta
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '0003'
+down_revision = '0002'
+branch_labels = None
+depends_on = None
+
+
+PROCESSING_LOGS_COLUMNS = """
+    id UUID NOT NULL,
+    content_hash VARCHAR(64) NOT NULL,
+    processing_type VARCHAR(50) NOT NULL,
+    status VARCHAR(20) NOT NULL,
+    processing_time_ms INTEGER NOT NULL,
+    ai_service_used VARCHAR(50),
+    error_message TEXT,
+    metadata JSON,
+    created_at TIMESTAMP WITHOUT TIME ZONE NOT NULL
+"""
+
+SYSTEM_METRICS_COLUMNS = """
+    id UUID NOT NULL,
+    metric_name VARCHAR(100) NOT NULL,
+    metric_value DOUBLE PRECISION NOT NULL,
+    metric_unit VARCHAR(20),
+    tags JSON,
+    timestamp TIMESTAMP WITHOUT TIME ZONE NOT NULL
+"""
+
+
+def _month_start(value: datetime) -> datetime:
+    return value.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+
+
+def _next_month(value: datetime) -> datetime:
+    return (value.replace(day=28) + timedelta(days=4)).replace(day=1)
+
+
+def _create_partitioned(table: str, columns: str, key: str, indexes: list) -> None:
+    """Rebuild table as a monthly RANGE-partitioned parent, keeping its rows"""
+    bind = op.get_bind()
+    staging = f"{table}_partitioned"
+
+    op.execute(
+        f"CREATE TABLE {staging} ({columns}, "
+        f"CONSTRAINT {table}_pkey_new PRIMARY KEY (id, {key})) "
+        f"PARTITION BY RANGE ({key})"
+    )
+    op.execute(f"CREATE TABLE {table}_default PARTITION OF {staging} DEFAULT")
+
+    # Monthly partitions covering existing rows through next month
+    oldest = bind.execute(sa.text(f"SELECT min({key}) FROM {table}")).scalar()
+    month = _month_start(oldest or datetime.utcnow())
+    last = _next_month(_month_start(datetime.utcnow()))
+    while month <= last:
+        next_month = _next_month(month)
+        op.execute(
+            f"CREATE TABLE {table}_{month:%Y_%m} PARTITION OF {staging} "
+            f"FOR VALUES FROM ('{month:%Y-%m-%d}') TO ('{next_month:%Y-%m-%d}')"
+        )
+        month = next_month
+
+    op.execute(f"INSERT INTO {staging} SELECT * FROM {table}")
+    op.execute(f"DROP TABLE {table}")
+    op.execute(f"ALTER TABLE {staging} RENAME TO {table}")
+    op.execute(f"ALTER TABLE {table} RENAME CONSTRAINT {table}_pkey_new TO {table}_pkey")
+
+    for name, cols in indexes:
+        op.create_index(name, table, cols, unique=False)
+
+
+def _create_plain(table: str, columns: str, indexes: list) -> None:
+    """Rebuild a partitioned table as a regular table, keeping its rows"""
+    staging = f"{table}_plain"
+
+    op.execute(f"CREATE TABLE {staging} ({columns}, CONSTRAINT {table}_pkey_new PRIMARY KEY (id))")
+    op.execute(f"INSERT INTO {staging} SELECT * FROM {table}")
+    op.execute(f"DROP TABLE {table}")
+    op.execute(f"ALTER TABLE {staging} RENAME TO {table}")
+    op.execute(f"ALTER TABLE {table} RENAME CONSTRAINT {table}_pkey_new TO {table}_pkey")
+
+    for name, cols in indexes:
+        op.create_index(name, table, cols, unique=False)
+
+
+PROCESSING_LOGS_INDEXES = [
+    ('idx_pl_content_hash', ['content_hash']),
+    ('idx_processing_type_status', ['processing_type', 'status']),
+    ('idx_pl_created_at', ['created_at']),
+    ('idx_processing_time', ['processing_time_ms']),
+]
+
+SYSTEM_METRICS_INDEXES = [
+    ('idx_metric_name', ['metric_name']),
+    ('idx_metric_name_timestamp', ['metric_name', 'timestamp']),
+    ('idx_timestamp', ['timestamp']),
+]
+
+
+def upgrade() -> None:
+    _create_partitioned('processing_logs', PROCESSING_LOGS_COLUMNS, 'created_at', PROCESSING_LOGS_INDEXES)
+    _create_partitioned('system_metrics', SYSTEM_METRICS_COLUMNS, 'timestamp', SYSTEM_METRICS_INDEXES)
+
+
+def downgrade() -> None:
+    _create_plain('system_metrics', SYSTEM_METRICS_COLUMNS, SYSTEM_METRICS_INDEXES)
+    _create_plain('processing_logs', PROCESSING_LOGS_COLUMNS, PROCESSING_LOGS_INDEXES)
@@ -0,0 +1,40 @@
+"""Store full content and derive content_preview as a generated column
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-15 11:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '0004'
+down_revision = '0003'
+branch_labels = None
+depends_on = None
+
+
+PREVIEW_EXPRESSION = "left(content, 500) || CASE WHEN length(content) > 500 THEN '...' ELSE '' END"
+
+
+def upgrade() -> None:
+    op.add_column('content_classifications', sa.Column('content', sa.Text(), nullable=True))
+    # Rows written before this revision only kept the preview
+    op.execute("UPDATE content_classifications SET content = content_preview")
+    op.alter_column('content_classifications', 'content', nullable=False)
+
+    op.drop_column('content_classifications', 'content_preview')
+    op.add_column('content_classifications', sa.Column(
+        'content_preview', sa.Text(), sa.Computed(PREVIEW_EXPRESSION, persisted=True)
+    ))
+
+
+def downgrade() -> None:
+    op.add_column('content_classifications', sa.Column('content_preview_plain', sa.Text(), nullable=True))
+    op.execute("UPDATE content_classifications SET content_preview_plain = content_preview")
+    op.drop_column('content_classifications', 'content_preview')
+    op.alter_column('content_classifications', 'content_preview_plain',
+                    new_column_name='content_preview', nullable=False)
+    op.drop_column('content_classifications', 'content')
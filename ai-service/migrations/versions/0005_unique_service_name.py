@@ -0,0 +1,24 @@
+"""Add unique constraint on ai_service_status.service_name
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2026-10-15 12:00:00.000000
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '0005'
+down_revision = '0004'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # service_name is the upsert key for coalesced status flushes (ON CONFLICT)
+    op.create_unique_constraint('uq_ai_service_status_service_name', 'ai_service_status', ['service_name'])
+
+
+def downgrade() -> None:
+    op.drop_constraint('uq_ai_service_status_service_name', 'ai_service_status', type_='unique')
@@ -0,0 +1,34 @@
+"""Convert JSON columns to JSONB and GIN-index system_metrics.tags
+
+Revision ID: 0006
+Revises: 0005
+Create Date: 2026-10-15 13:00:00.000000
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '0006'
+down_revision = '0005'
+branch_labels = None
+depends_on = None
+
+
+JSON_COLUMNS = [
+    ('processing_logs', 'metadata'),
+    ('system_metrics', 'tags'),
+    ('ai_service_status', 'metadata'),
+]
+
+
+def upgrade() -> None:
+    for table, column in JSON_COLUMNS:
+        op.execute(f"ALTER TABLE {table} ALTER COLUMN {column} TYPE jsonb USING {column}::jsonb")
+    op.create_index('idx_metrics_tags_gin', 'system_metrics', ['tags'], unique=False, postgresql_using='gin')
+
+
+def downgrade() -> None:
+    op.drop_index('idx_metrics_tags_gin', table_name='system_metrics')
+    for table, column in JSON_COLUMNS:
+        op.execute(f"ALTER TABLE {table} ALTER COLUMN {column} TYPE json USING {column}::json")
@@ -0,0 +1,26 @@
+"""Replace the content_classifications.created_at btree index with BRIN
+
+Revision ID: 0007
+Revises: 0006
+Create Date: 2026-10-15 14:00:00.000000
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '0007'
+down_revision = '0006'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.drop_index('idx_created_at', table_name='content_classifications', if_exists=True)
+    op.create_index('idx_created_at_brin', 'content_classifications', ['created_at'],
+                    unique=False, postgresql_using='brin')
+
+
+def downgrade() -> None:
+    op.drop_index('idx_created_at_brin', table_name='content_classifications')
+    op.create_index('idx_created_at', 'content_classifications', ['created_at'], unique=False)
@@ -0,0 +1,34 @@
+"""Drop single-column indexes already covered by composite or unique indexes
+
+Revision ID: 0008
+Revises: 0007
+Create Date: 2026-10-15 15:00:00.000000
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '0008'
+down_revision = '0007'
+branch_labels = None
+depends_on = None
+
+
+# (index, table, columns) -- each is a btree prefix of another index on the table
+REDUNDANT_INDEXES = [
+    ('idx_content_hash', 'content_classifications', ['content_hash']),
+    ('idx_tag', 'content_tags', ['tag']),
+    ('idx_metric_name', 'system_metrics', ['metric_name']),
+    ('idx_service_name', 'ai_service_status', ['service_name']),
+]
+
+
+def upgrade() -> None:
+    for name, table, _ in REDUNDANT_INDEXES:
+        op.drop_index(name, table_name=table, if_exists=True)
+
+
+def downgrade() -> None:
+    for name, table, columns in REDUNDANT_INDEXES:
+        op.create_index(name, table, columns, unique=False)
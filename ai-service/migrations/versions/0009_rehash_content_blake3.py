@@ -0,0 +1,77 @@
+"""Rehash content_classifications.content_hash from SHA-256 to BLAKE3
+
+Only rows whose stored hash equals sha256(content) can be rehashed. Rows whose
+content was backfilled from the truncated preview (0004) keep their SHA-256
+hash: BLAKE3 lookups and upserts never match them, so if that full content is
+submitted again it is stored as a new row. The skipped count is logged.
+
+Revision ID: 0009
+Revises: 0008
+Create Date: 2026-10-15 16:00:00.000000
+
+"""
+import hashlib
+import logging
+
+from alembic import op
+import sqlalchemy as sa
+from blake3 import blake3
+
+
+# revision identifiers, used by Alembic.
+revision = '0009'
+down_revision = '0008'
+branch_labels = None
+depends_on = None
+
+BATCH_SIZE = 1000
+
+logger = logging.getLogger(f"alembic.migration.{revision}")
+
+
+def _sha256_hex(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+def _blake3_hex(data: bytes) -> str:
+    return blake3(data).hexdigest()
+
+
+def _rehash(old_hash, new_hash) -> None:
+    # Only rows whose stored hash is verifiably old_hash(content) are rewritten; both
+    # digests are 64 hex chars, so the column and uq_cc_content_hash are unchanged.
+    # processing_logs keeps historical hashes as-is.
+    bind = op.get_bind()
+    rows = bind.execution_options(stream_results=True, yield_per=BATCH_SIZE).execute(
+        sa.text("SELECT id, content_hash, content FROM content_classifications")
+    )
+    update = sa.text("UPDATE content_classifications SET content_hash = :h WHERE id = :id")
+    batch = []
+    rehashed = skipped = 0
+    for row_id, content_hash, content in rows:
+        data = (content or '').encode('utf-8')
+        if content_hash != old_hash(data):
+            skipped += 1
+            continue
+        batch.append({'id': row_id, 'h': new_hash(data)})
+        rehashed += 1
+        if len(batch) >= BATCH_SIZE:
+            bind.execute(update, batch)
+            batch = []
+    if batch:
+        bind.execute(update, batch)
+    logger.info("Rehashed %d content_classifications rows", rehashed)
+    if skipped:
+        logger.warning(
+            "Kept the old hash on %d rows whose content does not match it (e.g. preview-only "
+            "rows from 0004); new submissions of that content will not deduplicate against them",
+            skipped,
+        )
+
+
+def upgrade() -> None:
+    _rehash(_sha256_hex, _blake3_hex)
+
+
+def downgrade() -> None:
+    _rehash(_blake3_hex, _sha256_hex)
@@ -0,0 +1,47 @@
+"""Replace btree indexes on append-ordered time columns with BRIN
+
+Revision ID: 0010
+Revises: 0009
+Create Date: 2026-10-15 17:00:00.000000
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '0010'
+down_revision = '0009'
+branch_labels = None
+depends_on = None
+
+
+BRIN_WITH = {'pages_per_range': 32}
+
+# (btree index, brin index, table, column); idx_metric_name_timestamp stays btree for point lookups
+TIME_INDEXES = [
+    ('idx_pl_created_at', 'idx_pl_created_at_brin', 'processing_logs', 'created_at'),
+    ('idx_timestamp', 'idx_timestamp_brin', 'system_metrics', 'timestamp'),
+    ('idx_last_successful_call', 'idx_last_successful_call_brin', 'ai_service_status', 'last_successful_call'),
+]
+
+
+def upgrade() -> None:
+    for btree, brin, table, column in TIME_INDEXES:
+        op.drop_index(btree, table_name=table, if_exists=True)
+        op.create_index(brin, table, [column], unique=False,
+                        postgresql_using='brin', postgresql_with=BRIN_WITH)
+
+    # Rebuild 0007's BRIN index with the same finer range size
+    op.drop_index('idx_created_at_brin', table_name='content_classifications')
+    op.create_index('idx_created_at_brin', 'content_classifications', ['created_at'], unique=False,
+                    postgresql_using='brin', postgresql_with=BRIN_WITH)
+
+
+def downgrade() -> None:
+    op.drop_index('idx_created_at_brin', table_name='content_classifications')
+    op.create_index('idx_created_at_brin', 'content_classifications', ['created_at'],
+                    unique=False, postgresql_using='brin')
+
+    for btree, brin, table, column in TIME_INDEXES:
+        op.drop_index(brin, table_name=table)
+        op.create_index(btree, table, [column], unique=False)
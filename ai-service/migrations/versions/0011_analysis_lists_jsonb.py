@@ -0,0 +1,43 @@
+"""Store content_analyses entities/key_concepts as JSONB with GIN indexes
+
+Revision ID: 0011
+Revises: 0010
+Create Date: 2026-10-15 18:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '0011'
+down_revision = '0010'
+branch_labels = None
+depends_on = None
+
+
+LIST_COLUMNS = [
+    ('entities', 'idx_ca_entities_gin'),
+    ('key_concepts', 'idx_ca_key_concepts_gin'),
+]
+
+
+def upgrade() -> None:
+    for column, index in LIST_COLUMNS:
+        op.execute(f"ALTER TABLE content_analyses ALTER COLUMN {column} TYPE jsonb USING to_jsonb({column})")
+        # jsonb_path_ops: smaller index, serves @> containment ("analyses mentioning X")
+        op.create_index(index, 'content_analyses', [column], unique=False, postgresql_using='gin',
+                        postgresql_ops={column: 'jsonb_path_ops'})
+
+
+def downgrade() -> None:
+    # ALTER ... USING cannot contain a subquery, so go through a staging column
+    for column, index in LIST_COLUMNS:
+        op.drop_index(index, table_name='content_analyses')
+        op.add_column('content_analyses', sa.Column(f'{column}_array', sa.ARRAY(sa.String())))
+        op.execute(
+            f"UPDATE content_analyses SET {column}_array = "
+            f"ARRAY(SELECT jsonb_array_elements_text({column}))"
+        )
+        op.drop_column('content_analyses', column)
+        op.alter_column('content_analyses', f'{column}_array', new_column_name=column, nullable=False)
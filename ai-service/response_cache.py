@@ -0,0 +1,80 @@
+"""
+AI provider response cache for 2nd-Brain-Auto (Ver. ENG)
+Exact-match cache for raw model replies, shared across workers through Redis
+"""
+
+import os
+import time
+import hashlib
+import logging
+from typing import Optional
+
+from cachetools import TTLCache
+
+try:
+    import redis.asyncio as aioredis
+except ImportError:  # optional: falls back to the process-local tier only
+    aioredis = None
+
+logger = logging.getLogger(__name__)
+
+RESPONSE_CACHE_TTL = int(os.getenv("RESPONSE_CACHE_TTL", "86400"))
+RESPONSE_CACHE_LOCAL_SIZE = int(os.getenv("RESPONSE_CACHE_LOCAL_SIZE", "2048"))
+RESPONSE_CACHE_PREFIX = "ai:response:v1:"
+REDIS_RETRY_SECONDS = 30.0
+
+class ResponseCache:
+    """Two tiers: a small in-process TTLCache in front of Redis (when REDIS_URL is set)"""
+
+    def __init__(self, redis_url: Optional[str] = None, ttl: int = RESPONSE_CACHE_TTL,
+                 local_size: int = RESPONSE_CACHE_LOCAL_SIZE):
+        self.ttl = ttl
+        self._local = TTLCache(maxsize=local_size, ttl=ttl)
+        self._redis = None
+        self._redis_retry_at = 0.0
+        if redis_url and aioredis is not None:
+            self._redis = aioredis.from_url(
+                redis_url, socket_connect_timeout=0.5, socket_timeout=0.5
+            )
+
+    @staticmethod
+    def make_key(service: str, namespace: str, prompt: str) -> str:
+        """Key on provider, calling service (model/system prompt) and the full prompt"""
+        digest = hashlib.sha256(f"{service}|{namespace}|{prompt}".encode("utf-8")).hexdigest()
+        return RESPONSE_CACHE_PREFIX + digest
+
+    def _redis_available(self) -> bool:
+        return self._redis is not None and time.monotonic() >= self._redis_retry_at
+
+    def _redis_failed(self, e: Exception) -> None:
+        # Back off instead of paying a timeout on every request while Redis is down
+        self._redis_retry_at = time.monotonic() + REDIS_RETRY_SECONDS
+        logger.warning("Response cache Redis unavailable for %.0fs: %s", REDIS_RETRY_SECONDS, e)
+
+    async def get(self, key: str) -> Optional[str]:
+        value = self._local.get(key)
+        if value is not None or not self._redis_available():
+            return value
+        try:
+            raw = await self._redis.get(key)
+        except Exception as e:
+            self._redis_failed(e)
+            return None
+        if raw is None:
+            return None
+        value = raw.decode("utf-8")
+        self._local[key] = value
+        return value
+
+    async def set(self, key: str, value: str) -> None:
+        self._local[key] = value
+        if not self._redis_available():
+            return
+        try:
+            await self._redis.set(key, value.encode("utf-8"), ex=self.ttl)
+        except Exception as e:
+            self._redis_failed(e)
+
+    async def close(self) -> None:
+        if self._redis is not None:
+            await self._redis.aclose()
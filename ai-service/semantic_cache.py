@@ -0,0 +1,101 @@
+"""
+Semantic (embedding-based) result cache for 2nd-Brain-Auto (Ver. ENG)
+Near-duplicate content reuses a previously generated AI result
+"""
+
+import os
+import pickle
+import logging
+from pathlib import Path
+from typing import Optional, Dict, List
+
+import orjson
+
+try:
+    import hnswlib
+except ImportError:  # optional: the cache is simply disabled without it
+    hnswlib = None
+
+logger = logging.getLogger(__name__)
+
+SEMANTIC_CACHE_DIR = Path(os.getenv("SEMANTIC_CACHE_DIR", Path(__file__).parent / "semantic_cache_data"))
+SEMANTIC_CACHE_THRESHOLD = float(os.getenv("SEMANTIC_CACHE_THRESHOLD", "0.08"))
+SEMANTIC_CACHE_MAX_ELEMENTS = int(os.getenv("SEMANTIC_CACHE_MAX_ELEMENTS", "100000"))
+EMBEDDING_DIM = int(os.getenv("EMBEDDING_DIM", "1536"))
+
+class SemanticCache:
+    """HNSW cosine index over content embeddings, mapping each label to a result dict"""
+
+    def __init__(self, name: str, dim: int = EMBEDDING_DIM,
+                 threshold: float = SEMANTIC_CACHE_THRESHOLD,
+                 max_elements: int = SEMANTIC_CACHE_MAX_ELEMENTS,
+                 directory: Path = SEMANTIC_CACHE_DIR):
+        self.name = name
+        self.dim = dim
+        self.threshold = threshold
+        self.max_elements = max_elements
+        # Index and values live in one file so a save replaces both atomically
+        self.path = Path(directory) / f"{name}.pkl"
+        self._values: List[Dict] = []
+        self._index = None
+
+    @property
+    def enabled(self) -> bool:
+        return self._index is not None
+
+    def load(self) -> None:
+        """Load the persisted index, or start an empty one"""
+        if hnswlib is None:
+            logger.info(f"hnswlib not installed; semantic cache '{self.name}' disabled")
+            return
+        if self.path.exists():
+            try:
+                raw_values, index = pickle.loads(self.path.read_bytes())
+                values = orjson.loads(raw_values)
+                if index.dim != self.dim or index.get_current_count() != len(values):
+                    raise ValueError("index does not match its values")
+                if index.get_max_elements() < self.max_elements:
+                    index.resize_index(self.max_elements)
+                index.set_ef(50)
+                self._values = values
+                self._index = index
+                logger.info(f"Loaded semantic cache '{self.name}' with {len(self._values)} entries")
+                return
+            except Exception as e:
+                logger.warning(f"Failed to load semantic cache '{self.name}', starting empty: {str(e)}")
+        index = hnswlib.Index(space='cosine', dim=self.dim)
+        index.init_index(max_elements=self.max_elements, ef_construction=200, M=16)
+        index.set_ef(50)
+        self._values = []
+        self._index = index
+
+    def save(self) -> None:
+        """Persist the index and its result dicts"""
+        if self._index is None:
+            return
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            # Write then rename: workers saving at shutdown each replace the whole
+            # file, so the last writer wins with a consistent index/values pair
+            tmp = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+            tmp.write_bytes(pickle.dumps((orjson.dumps(self._values), self._index)))
+            os.replace(tmp, self.path)
+        except Exception as e:
+            logger.error(f"Failed to save semantic cache '{self.name}': {str(e)}")
+
+    def lookup(self, embedding: Optional[List[float]]) -> Optional[Dict]:
+        """Return the nearest cached result if it is within the cosine distance threshold"""
+        if self._index is None or embedding is None or not self._values:
+            return None
+        labels, distances = self._index.knn_query([embedding], k=1)
+        label = int(labels[0][0])
+        if distances[0][0] < self.threshold and label < len(self._values):
+            return self._values[label]
+        return None
+
+    def add(self, embedding: Optional[List[float]], value: Dict) -> None:
+        """Remember a result; silently stops growing once the index is full"""
+        if self._index is None or embedding is None or len(self._values) >= self.max_elements:
+            return
+        self._index.add_items([embedding], [len(self._values)])
+        self._values.append(value)
@@ -0,0 +1,112 @@
+"""
+Tests for the semantic (HNSW) result cache and the provider response cache
+"""
+
+import asyncio
+import pickle
+
+import orjson
+import pytest
+
+from response_cache import ResponseCache, RESPONSE_CACHE_PREFIX
+from semantic_cache import SemanticCache
+
+
+@pytest.fixture
+def semantic(tmp_path):
+    pytest.importorskip("hnswlib")
+    cache = SemanticCache("classification", dim=3, threshold=0.05, max_elements=10, directory=tmp_path)
+    cache.load()
+    return cache
+
+
+class TestSemanticCache:
+    def test_disabled_until_loaded(self, tmp_path):
+        cache = SemanticCache("classification", dim=3, directory=tmp_path)
+        assert not cache.enabled
+        cache.add([1.0, 0.0, 0.0], {"category": "01-Projects"})
+        assert cache.lookup([1.0, 0.0, 0.0]) is None
+
+    def test_lookup_within_threshold(self, semantic):
+        semantic.add([1.0, 0.0, 0.0], {"category": "01-Projects"})
+        semantic.add([0.0, 1.0, 0.0], {"category": "03-Resources"})
+        assert semantic.lookup([0.99, 0.01, 0.0]) == {"category": "01-Projects"}
+        assert semantic.lookup([0.0, 0.0, 1.0]) is None
+        assert semantic.lookup(None) is None
+
+    def test_stops_growing_when_full(self, semantic):
+        for i in range(semantic.max_elements + 5):
+            semantic.add([1.0, float(i), 0.0], {"n": i})
+        assert len(semantic._values) == semantic.max_elements
+
+    def test_save_and_load_round_trip(self, semantic, tmp_path):
+        semantic.add([1.0, 0.0, 0.0], {"category": "01-Projects"})
+        semantic.save()
+        assert [p.name for p in tmp_path.iterdir()] == ["classification.pkl"]
+
+        reloaded = SemanticCache("classification", dim=3, threshold=0.05, max_elements=10, directory=tmp_path)
+        reloaded.load()
+        assert reloaded.lookup([1.0, 0.0, 0.0]) == {"category": "01-Projects"}
+
+    def test_mismatched_file_starts_empty(self, semantic, tmp_path):
+        semantic.add([1.0, 0.0, 0.0], {"category": "01-Projects"})
+        semantic.add([0.0, 1.0, 0.0], {"category": "03-Resources"})
+        # Values out of step with the index, e.g. from a torn write by an older version
+        semantic.path.write_bytes(pickle.dumps((orjson.dumps(semantic._values[:1]), semantic._index)))
+
+        reloaded = SemanticCache("classification", dim=3, threshold=0.05, max_elements=10, directory=tmp_path)
+        reloaded.load()
+        assert reloaded.enabled
+        assert reloaded._values == []
+
+    def test_out_of_range_label_is_a_miss(self, semantic):
+        semantic.add([1.0, 0.0, 0.0], {"category": "01-Projects"})
+        semantic.add([0.0, 1.0, 0.0], {"category": "03-Resources"})
+        del semantic._values[1:]
+        assert semantic.lookup([0.0, 1.0, 0.0]) is None
+
+
+class TestResponseCache:
+    def test_key_depends_on_every_part(self):
+        key = ResponseCache.make_key("openai", "AIClassificationService", "prompt")
+        assert key.startswith(RESPONSE_CACHE_PREFIX)
+        assert key == ResponseCache.make_key("openai", "AIClassificationService", "prompt")
+        assert key != ResponseCache.make_key("anthropic", "AIClassificationService", "prompt")
+        assert key != ResponseCache.make_key("openai", "AITaggingService", "prompt")
+        assert key != ResponseCache.make_key("openai", "AIClassificationService", "prompt!")
+
+    def test_local_tier_without_redis(self):
+        cache = ResponseCache(local_size=2)
+
+        async def scenario():
+            assert await cache.get("k") is None
+            await cache.set("k", '{"a": 1}')
+            assert await cache.get("k") == '{"a": 1}'
+            await cache.close()
+
+        asyncio.run(scenario())
+
+    def test_redis_failure_backs_off(self):
+        calls = []
+
+        class BrokenRedis:
+            async def get(self, key):
+                calls.append(key)
+                raise ConnectionError("redis down")
+
+            async def set(self, key, value, ex=None):
+                calls.append(key)
+                raise ConnectionError("redis down")
+
+        cache = ResponseCache()
+        cache._redis = BrokenRedis()
+
+        async def scenario():
+            assert await cache.get("a") is None
+            assert await cache.get("b") is None
+            await cache.set("c", "value")
+            assert await cache.get("c") == "value"
+
+        asyncio.run(scenario())
+        # Only the first call reaches Redis; the rest are served locally during the back-off
+        assert calls == ["a"]
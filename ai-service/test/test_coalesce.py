@@ -0,0 +1,100 @@
+"""
+Tests for single-flight coalescing of concurrent identical AI requests
+"""
+
+import asyncio
+
+import pytest
+
+from main import _coalesce
+
+
+@pytest.mark.asyncio
+async def test_concurrent_callers_share_one_call():
+    inflight = {}
+    calls = 0
+    gate = asyncio.Event()
+
+    async def work():
+        nonlocal calls
+        calls += 1
+        await gate.wait()
+        return {"category": "01-Projects"}
+
+    waiters = [asyncio.ensure_future(_coalesce(inflight, 1, work)) for _ in range(5)]
+    await asyncio.sleep(0)
+    assert list(inflight) == [1]
+
+    gate.set()
+    results = await asyncio.gather(*waiters)
+    assert calls == 1
+    assert all(result is results[0] for result in results)
+    assert inflight == {}
+
+
+@pytest.mark.asyncio
+async def test_different_keys_run_separately():
+    inflight = {}
+    seen = []
+
+    async def work(key):
+        seen.append(key)
+        return key
+
+    results = await asyncio.gather(*[_coalesce(inflight, key, lambda key=key: work(key)) for key in (1, 2)])
+    assert results == [1, 2]
+    assert sorted(seen) == [1, 2]
+
+
+@pytest.mark.asyncio
+async def test_released_after_completion():
+    inflight = {}
+    calls = 0
+
+    async def work():
+        nonlocal calls
+        calls += 1
+        return calls
+
+    assert await _coalesce(inflight, 1, work) == 1
+    await asyncio.sleep(0)
+    assert await _coalesce(inflight, 1, work) == 2
+
+
+@pytest.mark.asyncio
+async def test_errors_reach_every_waiter_and_release():
+    inflight = {}
+    gate = asyncio.Event()
+
+    async def work():
+        await gate.wait()
+        raise ValueError("provider down")
+
+    waiters = [asyncio.ensure_future(_coalesce(inflight, 1, work)) for _ in range(3)]
+    await asyncio.sleep(0)
+    gate.set()
+    results = await asyncio.gather(*waiters, return_exceptions=True)
+    assert all(isinstance(result, ValueError) for result in results)
+    assert inflight == {}
+
+
+@pytest.mark.asyncio
+async def test_cancelled_caller_does_not_cancel_shared_work():
+    inflight = {}
+    gate = asyncio.Event()
+
+    async def work():
+        await gate.wait()
+        return "done"
+
+    first = asyncio.ensure_future(_coalesce(inflight, 1, work))
+    second = asyncio.ensure_future(_coalesce(inflight, 1, work))
+    await asyncio.sleep(0)
+
+    first.cancel()
+    await asyncio.sleep(0)
+    assert first.cancelled()
+    assert 1 in inflight
+
+    gate.set()
+    assert await second == "done"
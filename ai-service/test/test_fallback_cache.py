@@ -0,0 +1,158 @@
+"""
+Tests that rule-based fallback results are returned but never cached, while parsed AI results are
+"""
+
+import asyncio
+from unittest import mock
+
+import pytest
+
+import main
+from semantic_cache import SemanticCache
+
+pytest.importorskip("hnswlib")
+
+EMBEDDING = [1.0, 0.0, 0.0, 0.0]
+AI_CLASSIFICATION = (
+    '{"category": "01-Projects", "confidence": 0.9, "priority": "high", "status": "active", '
+    '"complexity": "low", "estimated_time": "2 hours", "reasoning": "has a deadline"}'
+)
+AI_TAGS = '{"smart_tags": ["python"], "confidence": 0.8, "semantic_groups": {}, "related_topics": []}'
+AI_ANALYSIS = (
+    '{"entities": ["Python"], "sentiment": "positive", "complexity_score": 0.4, '
+    '"key_concepts": ["testing"], "summary": "About tests.", "language": "English"}'
+)
+
+
+@pytest.fixture
+def isolated(tmp_path):
+    """Fake DB/embedding layer and fresh caches around each test"""
+    db = mock.MagicMock()
+    db.get_classification_history = mock.AsyncMock(return_value=None)
+    db.save_classification = mock.AsyncMock(return_value=None)
+    db.save_tags = mock.AsyncMock(return_value=None)
+    db.save_analysis = mock.AsyncMock(return_value=None)
+    semantic = {}
+    for name in ("classify", "tagging", "analysis"):
+        cache = SemanticCache(name, dim=len(EMBEDDING), directory=tmp_path)
+        cache.load()
+        semantic[name] = cache
+    caches = (main._CLASSIFY_CACHE, main._TAGGING_CACHE, main._ANALYSIS_CACHE)
+    for cache in caches:
+        cache.clear()
+    with mock.patch.object(main, "db_manager", db), \
+            mock.patch.object(main, "_embed_content", mock.AsyncMock(return_value=EMBEDDING)), \
+            mock.patch.object(main, "_provider_router", main._ProviderRouter(["anthropic", "openai"])), \
+            mock.patch.object(main, "_CLASSIFY_SEMANTIC", semantic["classify"]), \
+            mock.patch.object(main, "_TAGGING_SEMANTIC", semantic["tagging"]), \
+            mock.patch.object(main, "_ANALYSIS_SEMANTIC", semantic["analysis"]):
+        yield semantic
+    for cache in caches:
+        cache.clear()
+
+
+async def _drain_writes():
+    pending = list(main._background_writes.values())
+    if pending:
+        await asyncio.gather(*pending, return_exceptions=True)
+
+
+@pytest.mark.asyncio
+async def test_classification_fallback_is_not_cached(isolated):
+    content = "Weekly notes with no JSON-producing provider"
+    service = main.AIClassificationService()
+    with mock.patch.object(service, "_call_ai_service",
+                           mock.AsyncMock(return_value="Sorry, I cannot help with that.")) as call:
+        result = await service.classify_content(content)
+    await _drain_writes()
+
+    assert call.await_count == 2  # primary, then the other provider
+    assert result.reasoning in ("Rule-based classification fallback", "Default classification to Areas")
+    assert main._cache_key(content) not in main._CLASSIFY_CACHE
+    assert isolated["classify"].lookup(EMBEDDING) is None
+
+    # The next request goes back to the providers instead of replaying the fallback
+    with mock.patch.object(service, "_call_ai_service",
+                           mock.AsyncMock(return_value=AI_CLASSIFICATION)):
+        result = await service.classify_content(content)
+    await _drain_writes()
+    assert result.category == "01-Projects"
+
+
+@pytest.mark.asyncio
+async def test_classification_success_is_cached(isolated):
+    content = "Ship the release by Friday"
+    service = main.AIClassificationService()
+    with mock.patch.object(service, "_call_ai_service",
+                           mock.AsyncMock(return_value="Here you go: " + AI_CLASSIFICATION)) as call:
+        first = await service.classify_content(content)
+        second = await service.classify_content(content)
+    await _drain_writes()
+
+    assert call.await_count == 1
+    assert second is first
+    assert main._CLASSIFY_CACHE[main._cache_key(content)] is first
+    assert isolated["classify"].lookup(EMBEDDING)["category"] == "01-Projects"
+
+
+@pytest.mark.asyncio
+async def test_primary_parse_failure_uses_fallback_provider(isolated):
+    content = "Reference material about databases"
+    service = main.AIClassificationService()
+    replies = mock.AsyncMock(side_effect=["not json", AI_CLASSIFICATION])
+    with mock.patch.object(service, "_call_ai_service", replies):
+        result = await service.classify_content(content)
+    await _drain_writes()
+
+    first_provider, second_provider = (c.args[1] for c in replies.await_args_list)
+    assert first_provider != second_provider
+    assert result.category == "01-Projects"
+    assert main._cache_key(content) in main._CLASSIFY_CACHE
+
+
+@pytest.mark.asyncio
+async def test_tagging_fallback_is_not_cached(isolated):
+    content = "Tag me if you can"
+    service = main.AITaggingService()
+    with mock.patch.object(service, "_call_ai_service", mock.AsyncMock(return_value="no tags")):
+        await service.generate_smart_tags(content)
+    assert main._cache_key(content) not in main._TAGGING_CACHE
+    assert isolated["tagging"].lookup(EMBEDDING) is None
+
+    with mock.patch.object(service, "_call_ai_service", mock.AsyncMock(return_value=AI_TAGS)):
+        result = await service.generate_smart_tags(content)
+    assert result.smart_tags == ["python"]
+    assert main._cache_key(content) in main._TAGGING_CACHE
+
+
+@pytest.mark.asyncio
+async def test_analysis_fallback_is_not_cached(isolated):
+    content = "Analyse this paragraph"
+    service = main.AIAnalysisService()
+    with mock.patch.object(service, "_call_ai_service", mock.AsyncMock(return_value="no analysis")):
+        await service.analyze_content(content)
+    await _drain_writes()
+    assert main._cache_key(content) not in main._ANALYSIS_CACHE
+    assert isolated["analysis"].lookup(EMBEDDING) is None
+
+    with mock.patch.object(service, "_call_ai_service", mock.AsyncMock(return_value=AI_ANALYSIS)):
+        result = await service.analyze_content(content)
+    await _drain_writes()
+    assert result.sentiment == "positive"
+    assert main._cache_key(content) in main._ANALYSIS_CACHE
+
+
+@pytest.mark.asyncio
+async def test_non_json_reply_is_not_response_cached(isolated):
+    service = main.AIClassificationService()
+    prompt = "prompt that yields prose"
+    key = main.ResponseCache.make_key("openai", type(service).__name__, prompt)
+    with mock.patch.object(main, "response_cache", main.ResponseCache()) as cache, \
+            mock.patch.object(service, "_call_openai", mock.AsyncMock(return_value="plain prose")):
+        assert await service._call_ai_service(prompt, "openai") == "plain prose"
+        assert await cache.get(key) is None
+
+    with mock.patch.object(main, "response_cache", main.ResponseCache()) as cache, \
+            mock.patch.object(service, "_call_openai", mock.AsyncMock(return_value=AI_CLASSIFICATION)):
+        await service._call_ai_service(prompt, "openai")
+        assert await cache.get(key) == AI_CLASSIFICATION
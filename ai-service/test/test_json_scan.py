@@ -0,0 +1,91 @@
+"""
+Tests for the JSON object scanners used on streamed and free-form provider replies
+"""
+
+import asyncio
+
+import orjson
+import pytest
+
+import main
+from main import _JsonObjectScanner, _find_json_span, _read_json_stream
+
+
+def _span_text(text):
+    span = _find_json_span(text)
+    return None if span is None else text[span[0]:span[1]]
+
+
+class TestFindJsonSpan:
+    def test_no_object(self):
+        assert _find_json_span("no json here") is None
+
+    def test_unbalanced_object(self):
+        assert _find_json_span('{"a": {"b": 1}') is None
+
+    def test_surrounding_prose_is_ignored(self):
+        text = 'Sure! Here it is: {"category": "01-Projects"} Hope that helps {x}'
+        assert _span_text(text) == '{"category": "01-Projects"}'
+
+    def test_nested_objects(self):
+        text = 'x {"a": {"b": {"c": 1}}, "d": 2} y'
+        assert orjson.loads(_span_text(text)) == {"a": {"b": {"c": 1}}, "d": 2}
+
+    def test_braces_inside_strings(self):
+        text = '{"reasoning": "use {curly} and } braces", "n": 1} trailing }'
+        assert orjson.loads(_span_text(text)) == {"reasoning": "use {curly} and } braces", "n": 1}
+
+    def test_escaped_quotes_and_backslashes(self):
+        obj = {"a": 'say "hi" }', "b": "C:\\path\\", "c": "\\\"}"}
+        text = "prefix " + orjson.dumps(obj).decode() + " suffix }"
+        assert orjson.loads(_span_text(text)) == obj
+
+
+class TestJsonObjectScanner:
+    def test_stops_at_closing_brace_across_chunks(self):
+        scanner = _JsonObjectScanner()
+        assert scanner.feed('{"a": ') is False
+        assert scanner.feed('{"b": "}"}') is False
+        assert scanner.feed('} and more text') is True
+        assert orjson.loads(scanner.text()) == {"a": {"b": "}"}}
+
+    def test_escape_split_between_chunks(self):
+        scanner = _JsonObjectScanner()
+        assert scanner.feed('{"a": "x\\') is False
+        assert scanner.feed('"}"') is False
+        assert scanner.feed('}') is True
+        assert orjson.loads(scanner.text()) == {"a": 'x"}'}
+
+    def test_leading_prose_before_object(self):
+        scanner = _JsonObjectScanner()
+        assert scanner.feed("} ignored {") is False
+        assert scanner.feed('"k": 1}') is True
+        assert scanner.text().endswith('{"k": 1}')
+
+    def test_read_json_stream_stops_reading(self):
+        consumed = []
+
+        async def texts():
+            for chunk in ['"a": 1', '}', ' never read']:
+                consumed.append(chunk)
+                yield chunk
+
+        result = asyncio.run(_read_json_stream(texts(), initial="{"))
+        assert orjson.loads(result) == {"a": 1}
+        assert consumed == ['"a": 1', '}']
+
+
+class TestParseResponses:
+    def test_parse_classification_embedded_json(self):
+        service = main.AIClassificationService()
+        parsed = service._parse_classification_response('Result: {"category": "03-Resources"} done')
+        assert parsed == {"category": "03-Resources"}
+
+    @pytest.mark.parametrize("parse", [
+        main.AIClassificationService()._parse_classification_response,
+        main.AITaggingService()._parse_tagging_response,
+        main.AIAnalysisService()._parse_analysis_response,
+    ])
+    def test_parse_without_json_raises(self, parse):
+        with pytest.raises(ValueError):
+            parse("I could not produce JSON for this one.")
@@ -0,0 +1,97 @@
+"""
+Tests for monthly partition maintenance, run against a fake connection that records SQL
+"""
+
+from contextlib import contextmanager
+from datetime import datetime
+from unittest import mock
+
+import pytest
+
+import database
+from database import PARTITIONED_TABLES, ensure_partitions, drop_expired_partitions
+
+
+class FrozenDatetime(datetime):
+    @classmethod
+    def utcnow(cls):
+        return cls(2026, 12, 15, 8, 30)
+
+
+class FakeConnection:
+    def __init__(self, lock_acquired=True, partitions=()):
+        self.statements = []
+        self.lock_acquired = lock_acquired
+        self.partitions = list(partitions)
+
+    def execute(self, statement, params=None):
+        sql = str(statement)
+        self.statements.append(sql)
+        result = mock.MagicMock()
+        result.scalar.return_value = self.lock_acquired
+        result.scalars.return_value.all.return_value = [
+            name for name in self.partitions if name.startswith(params["table"] + "_")
+        ] if params and "table" in params else []
+        return result
+
+    def ddl(self):
+        return [sql for sql in self.statements if not sql.startswith("SELECT")]
+
+
+@pytest.fixture
+def connect():
+    def install(**kwargs):
+        connection = FakeConnection(**kwargs)
+
+        @contextmanager
+        def begin():
+            yield connection
+
+        engine = mock.MagicMock()
+        engine.begin = begin
+        patcher = mock.patch.multiple(database, engine=engine, datetime=FrozenDatetime)
+        patcher.start()
+        patches.append(patcher)
+        return connection
+
+    patches = []
+    yield install
+    for patcher in patches:
+        patcher.stop()
+
+
+def test_ensure_partitions_creates_current_and_next_month(connect):
+    connection = connect()
+    assert ensure_partitions(months_ahead=1) is True
+
+    assert "pg_advisory_xact_lock" in connection.statements[0]
+    ddl = connection.ddl()
+    assert len(ddl) == 3 * len(PARTITIONED_TABLES)
+    for table in PARTITIONED_TABLES:
+        assert f"CREATE TABLE IF NOT EXISTS {table}_default PARTITION OF {table} DEFAULT" in ddl
+        # The roll-over crosses the year boundary
+        assert any(sql.startswith(f"CREATE TABLE IF NOT EXISTS {table}_2026_12 ")
+                   and "FROM ('2026-12-01') TO ('2027-01-01')" in sql for sql in ddl)
+        assert any(sql.startswith(f"CREATE TABLE IF NOT EXISTS {table}_2027_01 ")
+                   and "FROM ('2027-01-01') TO ('2027-02-01')" in sql for sql in ddl)
+
+
+def test_ensure_partitions_skips_when_lock_is_held(connect):
+    connection = connect(lock_acquired=False)
+    assert ensure_partitions(wait=False) is False
+    assert len(connection.statements) == 1
+    assert "pg_try_advisory_xact_lock" in connection.statements[0]
+
+
+def test_drop_expired_partitions_only_drops_whole_months(connect):
+    table = next(iter(PARTITIONED_TABLES))
+    connection = connect(partitions=[
+        f"{table}_default", f"{table}_2026_08", f"{table}_2026_09", f"{table}_2026_10",
+    ])
+    dropped = drop_expired_partitions(datetime(2026, 10, 1))
+
+    assert dropped == 2
+    assert connection.ddl() == [
+        f"DROP TABLE IF EXISTS {table}_2026_08",
+        f"DROP TABLE IF EXISTS {table}_2026_09",
+    ]
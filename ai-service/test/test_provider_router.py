@@ -0,0 +1,109 @@
+"""
+Tests for adaptive provider routing (EWMA latency, error weighting, circuit breaker)
+"""
+
+import asyncio
+import time
+
+import pytest
+
+import main
+from main import _ProviderRouter
+
+
+def test_duplicate_providers_are_collapsed():
+    router = _ProviderRouter(["openai", "openai"])
+    assert router.providers == ["openai"]
+
+
+def test_tie_prefers_primary():
+    router = _ProviderRouter(["anthropic", "openai"])
+    assert router.pick() == "anthropic"
+
+
+def test_pick_prefers_lower_latency():
+    router = _ProviderRouter(["anthropic", "openai"])
+    for _ in range(5):
+        router.record_success("anthropic", 3000.0)
+        router.record_success("openai", 200.0)
+    assert router.pick() == "openai"
+
+
+def test_ewma_update():
+    router = _ProviderRouter(["openai"], initial_ewma_ms=1000.0)
+    router.record_success("openai", 2000.0)
+    assert router.stats["openai"]["ewma_ms"] == pytest.approx(1100.0)
+
+
+def test_errors_outweigh_latency():
+    router = _ProviderRouter(["anthropic", "openai"])
+    router.record_success("anthropic", 500.0)
+    # A fast failure must not make a provider look fast
+    router.record_failure("openai", 1.0)
+    assert router.stats["openai"]["ewma_ms"] > router.stats["anthropic"]["ewma_ms"]
+    assert router.stats["openai"]["err_rate"] == pytest.approx(0.1)
+    assert router.pick() == "anthropic"
+
+
+def test_exclude():
+    router = _ProviderRouter(["anthropic", "openai"])
+    assert router.pick(exclude="anthropic") == "openai"
+    with pytest.raises(RuntimeError):
+        _ProviderRouter(["openai"]).pick(exclude="openai")
+
+
+def test_unknown_provider_is_ignored():
+    router = _ProviderRouter(["openai"])
+    router.record_success("fallback", 10.0)
+    router.record_failure("fallback")
+    assert list(router.stats) == ["openai"]
+
+
+def test_breaker_opens_after_threshold_and_backs_off():
+    router = _ProviderRouter(["anthropic", "openai"])
+    for _ in range(main.PROVIDER_FAILURE_THRESHOLD):
+        router.record_failure("anthropic")
+    assert router.snapshot()["anthropic"]["circuit_open"] is False
+
+    router.record_failure("anthropic")
+    stats = router.stats["anthropic"]
+    assert router.snapshot()["anthropic"]["circuit_open"] is True
+    assert stats["open_until"] == pytest.approx(time.monotonic() + main.PROVIDER_OPEN_SECONDS, abs=1.0)
+    assert stats["open_seconds"] == main.PROVIDER_OPEN_SECONDS * 2
+    assert len(stats["failures"]) == 0
+    # Even the lower-scored provider is skipped while its circuit is open
+    stats["ewma_ms"] = 1.0
+    stats["err_rate"] = 0.0
+    assert router.pick() == "openai"
+
+    # Half-open once the timeout passes; a success resets the back-off
+    stats["open_until"] = time.monotonic() - 1.0
+    assert router.pick() == "anthropic"
+    router.record_success("anthropic", 100.0)
+    assert stats["open_seconds"] == main.PROVIDER_OPEN_SECONDS
+
+
+def test_breaker_back_off_is_capped():
+    router = _ProviderRouter(["openai"])
+    for _ in range(20):
+        for _ in range(main.PROVIDER_FAILURE_THRESHOLD + 1):
+            router.record_failure("openai")
+    assert router.stats["openai"]["open_seconds"] == main.PROVIDER_OPEN_MAX_SECONDS
+
+
+def test_call_records_success_and_failure():
+    router = _ProviderRouter(["openai"])
+
+    async def ok():
+        return "reply"
+
+    async def fail():
+        raise ValueError("boom")
+
+    assert asyncio.run(router.call("openai", ok())) == "reply"
+    assert router.stats["openai"]["err_rate"] == 0.0
+
+    with pytest.raises(ValueError):
+        asyncio.run(router.call("openai", fail()))
+    assert router.stats["openai"]["err_rate"] == pytest.approx(0.1)
+    assert len(router.stats["openai"]["failures"]) == 1
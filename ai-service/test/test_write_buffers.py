@@ -0,0 +1,119 @@
+"""
+Tests for the buffered COPY writer and the coalescing AI service status accumulator
+"""
+
+import csv
+import io
+import time
+from contextlib import contextmanager
+from unittest import mock
+
+import pytest
+
+import db_utils
+from db_utils import _LogBuffer, _StatusAccumulator
+
+
+@pytest.fixture
+def raw_connection():
+    """Fake psycopg2 connection capturing each COPY statement and its CSV payload"""
+    raw = mock.MagicMock()
+    raw.copies = []
+    raw.cursor.return_value.copy_expert.side_effect = (
+        lambda sql, buf: raw.copies.append((sql, buf.getvalue()))
+    )
+    engine = mock.MagicMock()
+    engine.raw_connection.return_value = raw
+    with mock.patch.object(db_utils, "engine", engine):
+        yield raw
+
+
+def _rows(payload):
+    return list(csv.reader(io.StringIO(payload)))
+
+
+def test_flush_copies_all_rows_at_once(raw_connection):
+    buffer = _LogBuffer("processing_logs", ["id", "status", "error_message"], max_rows=100, flush_interval=3600)
+    buffer.append(("1", "success", None))
+    buffer.append(("2", "error", 'said "no", twice'))
+    buffer.flush()
+    buffer.close()
+
+    assert len(raw_connection.copies) == 1
+    sql, payload = raw_connection.copies[0]
+    assert sql.startswith("COPY processing_logs (id, status, error_message) FROM STDIN")
+    assert _rows(payload) == [["1", "success", "\\N"], ["2", "error", 'said "no", twice']]
+    raw_connection.commit.assert_called_once()
+    raw_connection.close.assert_called_once()
+
+
+def test_flush_without_rows_does_not_connect(raw_connection):
+    _LogBuffer("system_metrics", ["id"], flush_interval=3600).flush()
+    db_utils.engine.raw_connection.assert_not_called()
+
+
+def test_size_threshold_wakes_flusher(raw_connection):
+    buffer = _LogBuffer("system_metrics", ["id"], max_rows=3, flush_interval=3600)
+    for i in range(3):
+        buffer.append((str(i),))
+    deadline = time.monotonic() + 5
+    while not raw_connection.copies and time.monotonic() < deadline:
+        time.sleep(0.01)
+    buffer.close()
+
+    assert [_rows(payload) for _, payload in raw_connection.copies] == [[["0"], ["1"], ["2"]]]
+
+
+def test_failed_copy_rolls_back(raw_connection):
+    raw_connection.cursor.return_value.copy_expert.side_effect = RuntimeError("disk full")
+    buffer = _LogBuffer("system_metrics", ["id"], flush_interval=3600)
+    buffer.append(("1",))
+    buffer.close()
+
+    raw_connection.rollback.assert_called_once()
+    raw_connection.commit.assert_not_called()
+    raw_connection.close.assert_called_once()
+
+
+@pytest.fixture
+def executed():
+    """Capture (statement, rows) pairs instead of talking to the database"""
+    calls = []
+    db = mock.MagicMock()
+    db.execute.side_effect = lambda stmt, rows: calls.append((stmt, rows))
+
+    @contextmanager
+    def fake_scope():
+        yield db
+
+    with mock.patch.object(db_utils, "session_scope", fake_scope):
+        yield calls
+
+
+def test_status_updates_are_coalesced_per_service(executed):
+    accumulator = _StatusAccumulator(flush_interval=3600)
+    accumulator.add("openai", "active", 120, error_count=0, success_count=1)
+    accumulator.add("openai", "active", 80, error_count=0, success_count=1)
+    accumulator.add("openai", "error", None, error_count=1, success_count=0)
+    accumulator.add("anthropic", "active", 300, error_count=0, success_count=1)
+    accumulator.close()
+
+    assert len(executed) == 1
+    rows = {row["service_name"]: row for row in executed[0][1]}
+    assert set(rows) == {"openai", "anthropic"}
+    openai = rows["openai"]
+    assert (openai["success_count"], openai["error_count"]) == (2, 1)
+    # Latest status wins, but the last success time survives a later error
+    assert openai["status"] == "error"
+    assert openai["response_time_ms"] is None
+    assert openai["last_successful_call"] is not None
+    assert rows["anthropic"]["success_count"] == 1
+
+
+def test_status_flush_is_a_noop_when_idle(executed):
+    accumulator = _StatusAccumulator(flush_interval=3600)
+    accumulator.flush()
+    accumulator.add("openai", "active", 10, error_count=0, success_count=1)
+    accumulator.flush()
+    accumulator.flush()
+    assert len(executed) == 1